@@ -0,0 +1,47 @@
+"""make_recipe_rating_index_unique
+
+Revision ID: a3f1c2d4e5b6
+Revises: ce28a9ea4558
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c2d4e5b6'
+down_revision: str | None = 'ce28a9ea4558'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep the newest rating per (recipe, user) so the unique index can be built
+    op.execute(
+        """
+        DELETE FROM recipe_ratings
+        WHERE id NOT IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY recipe_id, user_id ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM recipe_ratings
+            ) ranked
+            WHERE rn = 1
+        )
+        """
+    )
+    op.drop_index('idx_recipe_user_rating', table_name='recipe_ratings')
+    op.create_index(
+        'idx_recipe_user_rating', 'recipe_ratings', ['recipe_id', 'user_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_recipe_user_rating', table_name='recipe_ratings')
+    op.create_index(
+        'idx_recipe_user_rating', 'recipe_ratings', ['recipe_id', 'user_id'], unique=False
+    )
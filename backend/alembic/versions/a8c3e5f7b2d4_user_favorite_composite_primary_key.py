@@ -0,0 +1,43 @@
+"""user_favorite_composite_primary_key
+
+Revision ID: a8c3e5f7b2d4
+Revises: f4b8d2e6a1c9
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3e5f7b2d4'
+down_revision: str | None = 'f4b8d2e6a1c9'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Dropping the id column also drops its primary key on PostgreSQL; SQLite rebuilds
+    # the table in batch mode
+    with op.batch_alter_table('user_favorites') as batch_op:
+        batch_op.drop_constraint('uq_user_recipe_favorite', type_='unique')
+        batch_op.drop_column('id')
+        batch_op.create_primary_key('user_favorites_pkey', ['user_id', 'recipe_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_favorites') as batch_op:
+        batch_op.add_column(sa.Column('id', sa.String(length=36), nullable=True))
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute('UPDATE user_favorites SET id = gen_random_uuid()::text')
+    else:
+        op.execute('UPDATE user_favorites SET id = lower(hex(randomblob(16)))')
+    with op.batch_alter_table('user_favorites') as batch_op:
+        batch_op.drop_constraint('user_favorites_pkey', type_='primary')
+        batch_op.alter_column('id', existing_type=sa.String(length=36), nullable=False)
+        batch_op.create_primary_key('user_favorites_pkey', ['id'])
+        batch_op.create_unique_constraint('uq_user_recipe_favorite', ['recipe_id', 'user_id'])
@@ -0,0 +1,31 @@
+"""drop_redundant_meal_plan_indexes
+
+Revision ID: b5d9f3a7c1e6
+Revises: a8c3e5f7b2d4
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d9f3a7c1e6'
+down_revision: str | None = 'a8c3e5f7b2d4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Both are covered by idx_meal_plan_date_type (household_id, meal_date, meal_type)
+    op.drop_index(op.f('ix_meal_plans_meal_date'), table_name='meal_plans')
+    op.drop_index(op.f('ix_meal_plans_household_id'), table_name='meal_plans')
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f('ix_meal_plans_household_id'), 'meal_plans', ['household_id'], unique=False
+    )
+    op.create_index(op.f('ix_meal_plans_meal_date'), 'meal_plans', ['meal_date'], unique=False)
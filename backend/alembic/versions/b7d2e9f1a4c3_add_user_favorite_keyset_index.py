@@ -0,0 +1,31 @@
+"""add_user_favorite_keyset_index
+
+Revision ID: b7d2e9f1a4c3
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e9f1a4c3'
+down_revision: str | None = 'a3f1c2d4e5b6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_user_favorite_user_created',
+        'user_favorites',
+        ['user_id', 'created_at', 'recipe_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_favorite_user_created', table_name='user_favorites')
@@ -0,0 +1,53 @@
+"""server_default_history_and_plan_timestamps
+
+Revision ID: c4e8a1f2d9b7
+Revises: b7d2e9f1a4c3
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f2d9b7'
+down_revision: str | None = 'b7d2e9f1a4c3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_COLUMNS = (
+    ('cooking_history', 'cooked_at'),
+    ('cooking_history', 'created_at'),
+    ('meal_plans', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            # Existing values were written as naive UTC
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.text('(CURRENT_TIMESTAMP)'),
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(timezone=True),
+                type_=sa.DateTime(),
+                server_default=None,
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
@@ -0,0 +1,39 @@
+"""add_ingredient_name_trigram_index
+
+Revision ID: ce28a9ea4558
+Revises: 6242b07aad17
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'ce28a9ea4558'
+down_revision: str | None = '6242b07aad17'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Trigram indexes are PostgreSQL-only; SQLite keeps the plain B-tree on name.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_ingredients_name_trgm',
+        'ingredients',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_ingredients_name_trgm', table_name='ingredients')
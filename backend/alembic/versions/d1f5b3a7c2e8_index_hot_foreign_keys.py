@@ -0,0 +1,49 @@
+"""index_hot_foreign_keys
+
+Revision ID: d1f5b3a7c2e8
+Revises: c4e8a1f2d9b7
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f5b3a7c2e8'
+down_revision: str | None = 'c4e8a1f2d9b7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEXES = (
+    ('dietary_preferences', 'user_id'),
+    ('health_goals', 'user_id'),
+    ('household_ingredients', 'ingredient_id'),
+    ('family_members', 'user_id'),
+    ('recipe_ingredients', 'recipe_id'),
+    ('shopping_cart_items', 'cart_id'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps PostgreSQL tables writable during the build but can't run
+    # inside a transaction; other dialects ignore the flag
+    with op.get_context().autocommit_block():
+        for table, column in _INDEXES:
+            op.create_index(
+                op.f(f'ix_{table}_{column}'),
+                table,
+                [column],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in _INDEXES:
+            op.drop_index(
+                op.f(f'ix_{table}_{column}'), table_name=table, postgresql_concurrently=True
+            )
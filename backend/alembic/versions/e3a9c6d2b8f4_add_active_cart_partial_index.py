@@ -0,0 +1,39 @@
+"""add_active_cart_partial_index
+
+Revision ID: e3a9c6d2b8f4
+Revises: d1f5b3a7c2e8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9c6d2b8f4'
+down_revision: str | None = 'd1f5b3a7c2e8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Partial indexes are only declared for PostgreSQL; SQLite keeps ix_shopping_carts_household_id
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        'ix_shopping_carts_household_active',
+        'shopping_carts',
+        ['household_id'],
+        unique=False,
+        postgresql_where=sa.text('is_active IS TRUE'),
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_shopping_carts_household_active', table_name='shopping_carts')
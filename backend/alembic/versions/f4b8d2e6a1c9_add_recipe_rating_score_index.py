@@ -0,0 +1,31 @@
+"""add_recipe_rating_score_index
+
+Revision ID: f4b8d2e6a1c9
+Revises: e3a9c6d2b8f4
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2e6a1c9'
+down_revision: str | None = 'e3a9c6d2b8f4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_recipe_rating_score',
+        'recipe_ratings',
+        ['recipe_id', 'score'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_recipe_rating_score', table_name='recipe_ratings')
@@ -1,17 +1,38 @@
 """CLI entry point: python -m app [--setting=value ...]"""
 from __future__ import annotations
 
+import os
+import sys
+
 import uvicorn
+from sqlalchemy.engine import make_url
 
 from app.config import settings
 
 
+def _worker_count() -> int | None:
+    if settings.debug:
+        # Reload mode supervises a single process and rejects workers
+        return None
+    if settings.workers > 0:
+        return settings.workers
+    # Workers would race each other through create_all, and SQLite serialises writers anyway
+    if settings.db_create_tables or make_url(settings.database_url).get_backend_name() == "sqlite":
+        return 1
+    return os.cpu_count()
+
+
 def main() -> None:
+    # Pin the C event loop and HTTP parser so a missing extra fails loudly instead
+    # of silently falling back to asyncio/h11. uvloop does not support Windows.
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=_worker_count(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
@@ -8,6 +8,9 @@ from app.api.deps import get_current_user
 from app.config import AIProvider, settings
 from app.models.user import User
 from app.schemas.ingredient import CameraScanRequest, CameraScanResult
+from app.services.ai import get_ai_service
+from app.services.ai.cache import ai_cache_key, cached_ai_call
+from app.services.ingredient import detect_ingredients_from_image
 
 router = APIRouter()
 
@@ -27,8 +30,6 @@ async def identify_ingredients(
     scan_data: CameraScanRequest,
     _current_user: User = Depends(get_current_user),
 ) -> CameraScanResult:
-    from app.services.ingredient import detect_ingredients_from_image
-
     return await detect_ingredients_from_image(scan_data.image_base64)
 
 
@@ -37,10 +38,11 @@ async def parse_voice_input(
     transcript: str,
     _current_user: User = Depends(get_current_user),
 ) -> dict[str, Any]:
-    from app.services.ai import get_ai_service
-
     ai_service = get_ai_service()
-    return await ai_service.parse_voice_input(transcript)
+    return await cached_ai_call(
+        ai_cache_key("parse_voice_input", transcript=transcript),
+        lambda: ai_service.parse_voice_input(transcript),
+    )
 
 
 @router.post("/suggest-substitutions")
@@ -50,11 +52,13 @@ async def suggest_substitutions(
     available_ingredients: list[str] | None = None,
     _current_user: User = Depends(get_current_user),
 ) -> list[dict[str, str]]:
-    from app.services.ai import get_ai_service
-
     ai_service = get_ai_service()
-    return await ai_service.suggest_substitutions(
-        original_ingredient=ingredient,
-        dietary_restrictions=dietary_restrictions or [],
-        available_ingredients=available_ingredients or [],
+    kwargs: dict[str, Any] = {
+        "original_ingredient": ingredient,
+        "dietary_restrictions": dietary_restrictions or [],
+        "available_ingredients": available_ingredients or [],
+    }
+    return await cached_ai_call(
+        ai_cache_key("suggest_substitutions", **kwargs),
+        lambda: ai_service.suggest_substitutions(**kwargs),
     )
@@ -1,29 +1,56 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.api.deps import HOUSEHOLD_PREFERENCE
+from app.database import get_db, upsert_insert
 from app.models.household import FamilyMember, Household
 from app.models.user import User
+from app.schemas.legal import TERMS_ETAG, TERMS_JSON, TermsResponse
 from app.schemas.user import TokenRefresh, TokenResponse, UserCreate, UserLogin, UserResponse
+from app.services.auth import get_oauth_authorization_url, get_oauth_user_info
 from app.utils.security import (
+    DUMMY_HASH,
     create_access_token,
     create_refresh_token,
     decode_token,
     hash_password,
+    login_cache,
+    login_cache_key,
+    password_needs_rehash,
     verify_password,
 )
 
 router = APIRouter()
 
 
-@router.get("/terms")
-async def get_terms() -> dict[str, str]:
-    from app.schemas.legal import TERMS_AND_CONDITIONS
+def _access_claims(user_id: str, household_id: str | None) -> dict[str, str]:
+    # "hh" is a hint: get_current_user confirms the membership before it is used
+    claims = {"sub": user_id}
+    if household_id is not None:
+        claims["hh"] = household_id
+    return claims
 
-    return {"terms_text": TERMS_AND_CONDITIONS, "version": "1.0"}
+
+def _issue_tokens(claims: dict[str, str]) -> dict[str, str]:
+    return {
+        "access_token": create_access_token(claims),
+        "refresh_token": create_refresh_token({"sub": claims["sub"]}),
+        "token_type": "bearer",
+    }
+
+
+@router.get("/terms", response_model=TermsResponse)
+async def get_terms(if_none_match: str | None = Header(default=None)) -> Response:
+    headers = {"ETag": TERMS_ETAG, "Cache-Control": "public, max-age=86400"}
+    if if_none_match is not None:
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        if TERMS_ETAG in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=TERMS_JSON, media_type="application/json", headers=headers)
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -34,33 +61,35 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
             detail="You must accept the terms and conditions to create an account",
         )
 
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing = result.scalar_one_or_none()
-    if existing:
+    # bcrypt is CPU-bound; run it off the event loop so other requests keep moving
+    hashed_password = await run_in_threadpool(hash_password, user_data.password)
+    result = await db.execute(
+        upsert_insert(db, User)
+        .values(
+            email=user_data.email,
+            hashed_password=hashed_password,
+            full_name=user_data.full_name,
+            auth_provider="local",
+            terms_accepted=True,
+            terms_version="1.0",
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
+    user = result.scalar_one_or_none()
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
 
-    user = User(
-        email=user_data.email,
-        hashed_password=hash_password(user_data.password),
-        full_name=user_data.full_name,
-        auth_provider="local",
-        terms_accepted=True,
-        terms_version="1.0",
-    )
-    db.add(user)
-    await db.flush()
-
-    household = Household(name=f"{user_data.full_name}'s Kitchen", owner_id=user.id)
-    db.add(household)
-    await db.flush()
-
-    member = FamilyMember(
-        household_id=household.id, user_id=user.id, name=user_data.full_name, role="owner"
+    db.add(
+        Household(
+            name=f"{user_data.full_name}'s Kitchen",
+            owner_id=user.id,
+            members=[FamilyMember(user_id=user.id, name=user_data.full_name, role="owner")],
+        )
     )
-    db.add(member)
     await db.flush()
 
     return user
@@ -68,26 +97,51 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
 
 @router.post("/login", response_model=TokenResponse)
 async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
-    result = await db.execute(select(User).where(User.email == credentials.email))
-    user = result.scalar_one_or_none()
+    cache_key = login_cache_key(credentials.email, credentials.password)
+    cached = login_cache.get(cache_key)
+    if cached is not None:
+        return _issue_tokens(cached)
 
-    if user is None or user.hashed_password is None:
+    # Fetch only the columns needed to authenticate; skips full User hydration
+    result = await db.execute(
+        select(User.id, User.hashed_password, User.is_active, FamilyMember.household_id)
+        .outerjoin(FamilyMember, FamilyMember.user_id == User.id)
+        .outerjoin(Household, Household.id == FamilyMember.household_id)
+        .where(User.email == credentials.email)
+        .order_by(*HOUSEHOLD_PREFERENCE)
+        .limit(1)
+    )
+    row = result.first()
+
+    if row is None or row.hashed_password is None:
+        # Spend a bcrypt round anyway so unknown emails aren't distinguishable by timing
+        await run_in_threadpool(verify_password, credentials.password, DUMMY_HASH)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await run_in_threadpool(verify_password, credentials.password, row.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
 
-    return {
-        "access_token": create_access_token({"sub": user.id}),
-        "refresh_token": create_refresh_token({"sub": user.id}),
-        "token_type": "bearer",
-    }
+    if not row.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is disabled",
+        )
+
+    if password_needs_rehash(row.hashed_password):
+        upgraded = await run_in_threadpool(hash_password, credentials.password)
+        await db.execute(
+            update(User).where(User.id == row.id).values(hashed_password=upgraded)
+        )
+
+    claims = _access_claims(row.id, row.household_id)
+    login_cache.set(cache_key, claims)
+    return _issue_tokens(claims)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -102,20 +156,23 @@ async def refresh_token(
         )
 
     user_id = payload.get("sub")
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    result = await db.execute(
+        select(User.id, User.is_active, FamilyMember.household_id)
+        .outerjoin(FamilyMember, FamilyMember.user_id == User.id)
+        .outerjoin(Household, Household.id == FamilyMember.household_id)
+        .where(User.id == user_id)
+        .order_by(*HOUSEHOLD_PREFERENCE)
+        .limit(1)
+    )
+    row = result.first()
 
-    if user is None or not user.is_active:
+    if row is None or not row.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or disabled",
         )
 
-    return {
-        "access_token": create_access_token({"sub": user.id}),
-        "refresh_token": create_refresh_token({"sub": user.id}),
-        "token_type": "bearer",
-    }
+    return _issue_tokens(_access_claims(row.id, row.household_id))
 
 
 @router.post("/oauth/{provider}/callback", response_model=TokenResponse)
@@ -130,8 +187,6 @@ async def oauth_callback(
             detail=f"Unsupported OAuth provider: {provider}",
         )
 
-    from app.services.auth import get_oauth_user_info
-
     user_info = await get_oauth_user_info(provider, code)
     if user_info is None:
         raise HTTPException(
@@ -146,6 +201,7 @@ async def oauth_callback(
         )
     )
     user = result.scalar_one_or_none()
+    household_id: str | None = None
 
     if user is None:
         email_result = await db.execute(select(User).where(User.email == user_info["email"]))
@@ -163,35 +219,31 @@ async def oauth_callback(
                 auth_provider_id=user_info["id"],
                 is_verified=True,
             )
-            db.add(user)
-            await db.flush()
-
+            # Relationships let the unit of work order and key all three INSERTs in one flush
             household = Household(
-                name=f"{user_info.get('name', 'My')}'s Kitchen", owner_id=user.id
+                name=f"{user_info.get('name', 'My')}'s Kitchen",
+                owner=user,
+                members=[FamilyMember(user=user, name=user_info.get("name", ""), role="owner")],
             )
             db.add(household)
             await db.flush()
+            household_id = household.id
+
+    if household_id is None:
+        member_result = await db.execute(
+            select(FamilyMember.household_id)
+            .join(Household, Household.id == FamilyMember.household_id)
+            .where(FamilyMember.user_id == user.id)
+            .order_by(*HOUSEHOLD_PREFERENCE)
+            .limit(1)
+        )
+        household_id = member_result.scalar_one_or_none()
 
-            member = FamilyMember(
-                household_id=household.id,
-                user_id=user.id,
-                name=user_info.get("name", ""),
-                role="owner",
-            )
-            db.add(member)
-            await db.flush()
-
-    return {
-        "access_token": create_access_token({"sub": user.id}),
-        "refresh_token": create_refresh_token({"sub": user.id}),
-        "token_type": "bearer",
-    }
+    return _issue_tokens(_access_claims(user.id, household_id))
 
 
 @router.get("/oauth/{provider}/url")
 async def get_oauth_url(provider: str) -> dict[str, str]:
-    from app.services.auth import get_oauth_authorization_url
-
     url = get_oauth_authorization_url(provider)
     if url is None:
         raise HTTPException(
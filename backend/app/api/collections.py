@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import Exists, delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.deps import get_current_user
-from app.database import get_db
+from app.database import get_db, insert_where
 from app.models.recipe import Recipe, RecipeCollection, RecipeCollectionItem
 from app.models.user import User
 from app.schemas.collection import (
@@ -20,17 +22,20 @@ from app.schemas.collection import (
 router = APIRouter()
 
 
+def _owned_collection(collection_id: str, user_id: str) -> Exists:
+    return exists().where(
+        RecipeCollection.id == collection_id,
+        RecipeCollection.user_id == user_id,
+    )
+
+
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_collection(
     data: CollectionCreate,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> RecipeCollection:
-    collection = RecipeCollection(
-        user_id=current_user.id,
-        name=data.name,
-        description=data.description,
-    )
+    collection = RecipeCollection(user_id=current_user.id, **data.model_dump())
     db.add(collection)
     await db.flush()
     return collection
@@ -40,13 +45,15 @@ async def create_collection(
 async def list_collections(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[RecipeCollection]:
+) -> Sequence[RecipeCollection]:
     result = await db.execute(
         select(RecipeCollection)
         .where(RecipeCollection.user_id == current_user.id)
         .order_by(RecipeCollection.created_at.desc())
+        # CollectionResponse has no relationships; fail loudly instead of lazy-loading per row
+        .options(raiseload("*"))
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 @router.get("/{collection_id}", response_model=CollectionDetailResponse)
@@ -61,7 +68,7 @@ async def get_collection(
             RecipeCollection.id == collection_id,
             RecipeCollection.user_id == current_user.id,
         )
-        .options(selectinload(RecipeCollection.items))
+        .options(selectinload(RecipeCollection.items), raiseload("*"))
     )
     collection = result.scalar_one_or_none()
     if collection is None:
@@ -82,39 +89,35 @@ async def add_recipe_to_collection(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> RecipeCollectionItem:
-    collection_result = await db.execute(
-        select(RecipeCollection).where(
-            RecipeCollection.id == collection_id,
-            RecipeCollection.user_id == current_user.id,
-        )
-    )
-    if collection_result.scalar_one_or_none() is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
-        )
-
-    recipe_result = await db.execute(select(Recipe).where(Recipe.id == data.recipe_id))
-    if recipe_result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    existing = await db.execute(
-        select(RecipeCollectionItem).where(
-            RecipeCollectionItem.collection_id == collection_id,
-            RecipeCollectionItem.recipe_id == data.recipe_id,
+    # Ownership and the recipe are checked inside the INSERT; only a zero-row result needs
+    # a second look to tell which guard failed
+    owned = _owned_collection(collection_id, current_user.id)
+    recipe_exists = exists().where(Recipe.id == data.recipe_id)
+    result = await db.execute(
+        insert_where(
+            db,
+            RecipeCollectionItem,
+            {"collection_id": collection_id, "recipe_id": data.recipe_id},
+            owned,
+            recipe_exists,
         )
+        .on_conflict_do_nothing(index_elements=["collection_id", "recipe_id"])
+        .returning(RecipeCollectionItem)
     )
-    if existing.scalar_one_or_none() is not None:
+    item = result.scalar_one_or_none()
+    if item is None:
+        guards = await db.execute(select(owned, recipe_exists))
+        is_owned, recipe_found = guards.one()
+        if not recipe_found:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
+        if not is_owned:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Recipe already in collection",
         )
-
-    item = RecipeCollectionItem(
-        collection_id=collection_id,
-        recipe_id=data.recipe_id,
-    )
-    db.add(item)
-    await db.flush()
     return item
 
 
@@ -128,24 +131,14 @@ async def remove_recipe_from_collection(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    collection_result = await db.execute(
-        select(RecipeCollection).where(
-            RecipeCollection.id == collection_id,
-            RecipeCollection.user_id == current_user.id,
-        )
-    )
-    if collection_result.scalar_one_or_none() is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
-        )
-
     result = await db.execute(
         delete(RecipeCollectionItem).where(
             RecipeCollectionItem.collection_id == collection_id,
             RecipeCollectionItem.recipe_id == recipe_id,
-        )
+            _owned_collection(collection_id, current_user.id),
+        ).returning(RecipeCollectionItem.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not in collection"
         )
@@ -161,9 +154,9 @@ async def delete_collection(
         delete(RecipeCollection).where(
             RecipeCollection.id == collection_id,
             RecipeCollection.user_id == current_user.id,
-        )
+        ).returning(RecipeCollection.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Collection not found"
         )
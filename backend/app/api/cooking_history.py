@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_user_household_id
-from app.database import get_db
+from app.database import fetch_page, get_db, insert_where
 from app.models.cooking_history import CookingHistory
 from app.models.recipe import Recipe
 from app.models.user import User
@@ -17,6 +18,8 @@ from app.schemas.cooking_history import (
 
 router = APIRouter()
 
+_HISTORY_LIST = TypeAdapter(list[CookingHistoryResponse])
+
 
 @router.post("/", response_model=CookingHistoryResponse, status_code=status.HTTP_201_CREATED)
 async def log_cooked_recipe(
@@ -25,19 +28,14 @@ async def log_cooked_recipe(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> CookingHistory:
-    result = await db.execute(select(Recipe).where(Recipe.id == data.recipe_id))
-    if result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    entry = CookingHistory(
-        user_id=current_user.id,
-        recipe_id=data.recipe_id,
-        household_id=household_id,
-        servings_made=data.servings_made,
-        notes=data.notes,
+    values = {"user_id": current_user.id, "household_id": household_id, **data.model_dump()}
+    result = await db.execute(
+        insert_where(db, CookingHistory, values, exists().where(Recipe.id == data.recipe_id))
+        .returning(CookingHistory)
     )
-    db.add(entry)
-    await db.flush()
+    entry = result.scalar_one_or_none()
+    if entry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
     return entry
 
 
@@ -48,24 +46,17 @@ async def get_cooking_history(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedCookingHistoryResponse:
-    count_result = await db.execute(
-        select(func.count()).select_from(CookingHistory).where(
-            CookingHistory.user_id == current_user.id
-        )
-    )
-    total = count_result.scalar() or 0
-
-    result = await db.execute(
+    items, total = await fetch_page(
+        db,
         select(CookingHistory)
         .where(CookingHistory.user_id == current_user.id)
-        .order_by(CookingHistory.cooked_at.desc())
-        .limit(limit)
-        .offset(offset)
+        .order_by(CookingHistory.cooked_at.desc()),
+        limit,
+        offset,
     )
-    items = list(result.scalars().all())
 
     return PaginatedCookingHistoryResponse(
-        items=[CookingHistoryResponse.model_validate(item) for item in items],
+        items=_HISTORY_LIST.validate_python(items, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
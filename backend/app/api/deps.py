@@ -1,23 +1,32 @@
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, status
+from typing import Any
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.models.household import FamilyMember, Household
 from app.models.user import User
 from app.utils.security import decode_token
 
 security = HTTPBearer()
 
+# Users in several households act in the one they own, else the one they joined first;
+# the id breaks created_at ties so the choice never depends on row order
+HOUSEHOLD_PREFERENCE = (
+    case((Household.owner_id == FamilyMember.user_id, 0), else_=1),
+    FamilyMember.created_at,
+    FamilyMember.id,
+)
 
-async def get_current_user(
+
+async def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = credentials.credentials
-    payload = decode_token(token)
+) -> dict[str, Any]:
+    payload = decode_token(credentials.credentials)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,7 +39,14 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token type",
         )
+    return payload
+
 
+async def get_current_user(
+    request: Request,
+    payload: dict[str, Any] = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db),
+) -> User:
     user_id: str | None = payload.get("sub")
     if user_id is None:
         raise HTTPException(
@@ -38,8 +54,25 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # The token's "hh" claim is only a hint, since a token can outlive the membership it
+    # was issued for; check it in the same statement that loads the user so that
+    # get_user_household_id needs no query of its own
+    hinted: str | None = payload.get("hh")
+    is_member = False
+    if hinted is None:
+        user = await db.get(User, user_id)
+    else:
+        membership = (
+            select(FamilyMember.id)
+            .where(FamilyMember.user_id == user_id, FamilyMember.household_id == hinted)
+            .exists()
+        )
+        result = await db.execute(
+            select(User, membership.label("is_member")).where(User.id == user_id)
+        )
+        row = result.first()
+        user, is_member = (row.User, row.is_member) if row is not None else (None, False)
+
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -52,17 +85,27 @@ async def get_current_user(
             detail="User account is disabled",
         )
 
+    if is_member:
+        request.state.household_id = hinted
     return user
 
 
 async def get_user_household_id(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> str:
-    from app.models.household import FamilyMember
+    # Set by get_current_user once the token's household claim is confirmed
+    household_id: str | None = getattr(request.state, "household_id", None)
+    if household_id is not None:
+        return household_id
 
     result = await db.execute(
-        select(FamilyMember.household_id).where(FamilyMember.user_id == current_user.id)
+        select(FamilyMember.household_id)
+        .join(Household, Household.id == FamilyMember.household_id)
+        .where(FamilyMember.user_id == current_user.id)
+        .order_by(*HOUSEHOLD_PREFERENCE)
+        .limit(1)
     )
     household_id = result.scalar_one_or_none()
     if household_id is None:
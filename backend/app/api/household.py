@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -24,8 +26,7 @@ async def get_household(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> Household:
-    result = await db.execute(select(Household).where(Household.id == household_id))
-    household = result.scalar_one_or_none()
+    household = await db.get(Household, household_id)
     if household is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Household not found")
     return household
@@ -56,11 +57,11 @@ async def create_household(
 async def get_members(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
-) -> list[FamilyMember]:
+) -> Sequence[FamilyMember]:
     result = await db.execute(
         select(FamilyMember).where(FamilyMember.household_id == household_id)
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 @router.post(
@@ -73,13 +74,7 @@ async def add_member(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> FamilyMember:
-    member = FamilyMember(
-        household_id=household_id,
-        user_id=data.user_id,
-        name=data.name,
-        role=data.role,
-        dietary_notes=data.dietary_notes,
-    )
+    member = FamilyMember(household_id=household_id, **data.model_dump())
     db.add(member)
     await db.flush()
     return member
@@ -123,7 +118,7 @@ async def remove_member(
         delete(FamilyMember).where(
             FamilyMember.id == member_id,
             FamilyMember.household_id == household_id,
-        )
+        ).returning(FamilyMember.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Member not found")
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, func, select
+from pydantic import TypeAdapter
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_current_user, get_user_household_id
-from app.database import get_db
+from app.database import fetch_page, get_db
 from app.models.ingredient import HouseholdIngredient, Ingredient
 from app.models.user import User
 from app.schemas.ingredient import (
@@ -21,9 +22,14 @@ from app.schemas.ingredient import (
     PaginatedIngredientResponse,
     PaginatedHouseholdIngredientResponse,
 )
+from app.services.barcode import lookup_barcode
+from app.services.ingredient import detect_ingredients_from_image
 
 router = APIRouter()
 
+_INGREDIENT_LIST = TypeAdapter(list[IngredientResponse])
+_HOUSEHOLD_INGREDIENT_LIST = TypeAdapter(list[HouseholdIngredientResponse])
+
 
 @router.get("/search", response_model=PaginatedIngredientResponse)
 async def search_ingredients(
@@ -33,23 +39,19 @@ async def search_ingredients(
     db: AsyncSession = Depends(get_db),
     _current_user: User = Depends(get_current_user),
 ) -> PaginatedIngredientResponse:
-    count_result = await db.execute(
-        select(func.count())
-        .select_from(Ingredient)
-        .where(Ingredient.name.ilike(f"%{q}%"))
-    )
-    total = count_result.scalar() or 0
-
-    result = await db.execute(
+    # Substring matches are served by the pg_trgm index on PostgreSQL. Trigram
+    # indexes can't help single-character queries, so those use a prefix match.
+    pattern = f"{q}%" if len(q) < 2 else f"%{q}%"
+    items, total = await fetch_page(
+        db,
         select(Ingredient)
-        .where(Ingredient.name.ilike(f"%{q}%"))
-        .order_by(Ingredient.name)
-        .limit(limit)
-        .offset(offset)
+        .where(Ingredient.name.ilike(pattern))
+        .order_by(Ingredient.name),
+        limit,
+        offset,
     )
-    items = list(result.scalars().all())
     return PaginatedIngredientResponse(
-        items=[IngredientResponse.model_validate(item) for item in items],
+        items=_INGREDIENT_LIST.validate_python(items, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
@@ -62,14 +64,7 @@ async def create_ingredient(
     db: AsyncSession = Depends(get_db),
     _current_user: User = Depends(get_current_user),
 ) -> Ingredient:
-    ingredient = Ingredient(
-        name=ingredient_data.name,
-        category=ingredient_data.category,
-        barcode=ingredient_data.barcode,
-        brand=ingredient_data.brand,
-        description=ingredient_data.description,
-        common_allergens=ingredient_data.common_allergens,
-    )
+    ingredient = Ingredient(**ingredient_data.model_dump())
     db.add(ingredient)
     await db.flush()
     return ingredient
@@ -82,24 +77,17 @@ async def get_household_ingredients(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedHouseholdIngredientResponse:
-    count_result = await db.execute(
-        select(func.count())
-        .select_from(HouseholdIngredient)
-        .where(HouseholdIngredient.household_id == household_id)
-    )
-    total = count_result.scalar() or 0
-
-    result = await db.execute(
+    items, total = await fetch_page(
+        db,
         select(HouseholdIngredient)
         .where(HouseholdIngredient.household_id == household_id)
         .options(selectinload(HouseholdIngredient.ingredient))
-        .order_by(HouseholdIngredient.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+        .order_by(HouseholdIngredient.created_at.desc()),
+        limit,
+        offset,
     )
-    items = list(result.scalars().all())
     return PaginatedHouseholdIngredientResponse(
-        items=[HouseholdIngredientResponse.model_validate(item) for item in items],
+        items=_HOUSEHOLD_INGREDIENT_LIST.validate_python(items, from_attributes=True),
         total=total,
         limit=limit,
         offset=offset,
@@ -117,30 +105,34 @@ async def add_household_ingredient(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> HouseholdIngredient:
-    ingredient_id = data.ingredient_id
+    ingredient: Ingredient | None = None
 
-    if ingredient_id is None and data.barcode:
-        from app.services.barcode import lookup_barcode
+    if data.ingredient_id is not None:
+        ingredient = await db.get(Ingredient, data.ingredient_id)
+        if ingredient is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Ingredient not found"
+            )
 
+    if ingredient is None and data.barcode:
         barcode_result = await lookup_barcode(data.barcode, db)
         if barcode_result and barcode_result.ingredient:
-            ingredient_id = barcode_result.ingredient.id
+            # lookup_barcode left the row in this session, so get() is an identity-map hit
+            ingredient = await db.get(Ingredient, barcode_result.ingredient.id)
 
-    if ingredient_id is None and data.name:
+    if ingredient is None and data.name:
         ingredient = Ingredient(name=data.name, barcode=data.barcode)
-        db.add(ingredient)
-        await db.flush()
-        ingredient_id = ingredient.id
 
-    if ingredient_id is None:
+    if ingredient is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Must provide ingredient_id, name, or barcode",
         )
 
+    # Assigning the relationship fills the response without re-selecting after the flush
     household_ingredient = HouseholdIngredient(
         household_id=household_id,
-        ingredient_id=ingredient_id,
+        ingredient=ingredient,
         quantity=data.quantity,
         unit=data.unit,
         expiry_date=data.expiry_date,
@@ -149,13 +141,7 @@ async def add_household_ingredient(
     )
     db.add(household_ingredient)
     await db.flush()
-
-    result = await db.execute(
-        select(HouseholdIngredient)
-        .where(HouseholdIngredient.id == household_ingredient.id)
-        .options(selectinload(HouseholdIngredient.ingredient))
-    )
-    return result.scalar_one()
+    return household_ingredient
 
 
 @router.patch("/household/{item_id}", response_model=HouseholdIngredientResponse)
@@ -198,9 +184,9 @@ async def remove_household_ingredient(
         delete(HouseholdIngredient).where(
             HouseholdIngredient.id == item_id,
             HouseholdIngredient.household_id == household_id,
-        )
+        ).returning(HouseholdIngredient.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
 
@@ -210,8 +196,6 @@ async def scan_barcode(
     db: AsyncSession = Depends(get_db),
     _current_user: User = Depends(get_current_user),
 ) -> BarcodeScanResult:
-    from app.services.barcode import lookup_barcode
-
     result = await lookup_barcode(barcode, db)
     if result is None:
         return BarcodeScanResult(
@@ -225,6 +209,4 @@ async def camera_scan(
     scan_data: CameraScanRequest,
     _current_user: User = Depends(get_current_user),
 ) -> CameraScanResult:
-    from app.services.ingredient import detect_ingredients_from_image
-
     return await detect_ingredients_from_image(scan_data.image_base64)
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, select
+from sqlalchemy import Float, case, cast, delete, exists, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_user_household_id
-from app.database import get_db
+from app.database import get_db, insert_where
 from app.models.meal_plan import MealPlan
 from app.models.recipe import Recipe, RecipeIngredient
 from app.models.shopping import ShoppingCart, ShoppingCartItem
@@ -28,21 +29,18 @@ async def create_meal_plan(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> MealPlan:
-    result = await db.execute(select(Recipe).where(Recipe.id == data.recipe_id))
-    if result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    meal_plan = MealPlan(
-        household_id=household_id,
-        recipe_id=data.recipe_id,
-        meal_date=data.meal_date,
-        meal_type=data.meal_type,
-        servings=data.servings,
-        notes=data.notes,
-        created_by_user_id=current_user.id,
+    values = {
+        "household_id": household_id,
+        "created_by_user_id": current_user.id,
+        **data.model_dump(),
+    }
+    result = await db.execute(
+        insert_where(db, MealPlan, values, exists().where(Recipe.id == data.recipe_id))
+        .returning(MealPlan)
     )
-    db.add(meal_plan)
-    await db.flush()
+    meal_plan = result.scalar_one_or_none()
+    if meal_plan is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
     return meal_plan
 
 
@@ -52,7 +50,7 @@ async def get_meal_plans(
     end_date: datetime = Query(..., description="End date for meal plan range"),
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
-) -> list[MealPlan]:
+) -> Sequence[MealPlan]:
     result = await db.execute(
         select(MealPlan)
         .where(
@@ -62,7 +60,7 @@ async def get_meal_plans(
         )
         .order_by(MealPlan.meal_date, MealPlan.meal_type)
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 @router.put("/{meal_plan_id}", response_model=MealPlanResponse)
@@ -72,21 +70,20 @@ async def update_meal_plan(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> MealPlan:
+    # The new recipe's existence rides along with the meal plan lookup
     result = await db.execute(
-        select(MealPlan).where(
+        select(MealPlan, exists().where(Recipe.id == update_data.recipe_id)).where(
             MealPlan.id == meal_plan_id,
             MealPlan.household_id == household_id,
         )
     )
-    meal_plan = result.scalar_one_or_none()
-    if meal_plan is None:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Meal plan not found")
+    meal_plan, recipe_exists = row
 
     if update_data.recipe_id is not None:
-        recipe_result = await db.execute(
-            select(Recipe).where(Recipe.id == update_data.recipe_id)
-        )
-        if recipe_result.scalar_one_or_none() is None:
+        if not recipe_exists:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found"
             )
@@ -114,9 +111,9 @@ async def delete_meal_plan(
         delete(MealPlan).where(
             MealPlan.id == meal_plan_id,
             MealPlan.household_id == household_id,
-        )
+        ).returning(MealPlan.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Meal plan not found"
         )
@@ -131,27 +128,43 @@ async def generate_shopping_list(
     db: AsyncSession = Depends(get_db),
 ) -> list[dict[str, str | float | None]]:
     """Auto-generate shopping list items from meal plan recipes in a date range."""
-    meal_plans_result = await db.execute(
-        select(MealPlan)
+    # How many batches of each recipe the range calls for, e.g. a 4-serving recipe
+    # planned once for 2 and once for 6 people needs 2x its listed quantities
+    batches = func.sum(
+        case(
+            (Recipe.servings > 0, cast(MealPlan.servings, Float) / Recipe.servings),
+            else_=1.0,
+        )
+    )
+    planned = (
+        select(MealPlan.recipe_id, batches.label("scale"))
+        .join(Recipe, Recipe.id == MealPlan.recipe_id)
         .where(
             MealPlan.household_id == household_id,
             MealPlan.meal_date >= start_date,
             MealPlan.meal_date <= end_date,
         )
+        .group_by(MealPlan.recipe_id)
+        .subquery()
+    )
+    # Collapse repeated ingredients in SQL so the cart gets one row per ingredient and unit
+    ingredient_key = func.coalesce(
+        RecipeIngredient.ingredient_id, func.lower(RecipeIngredient.name)
     )
-    meal_plans = meal_plans_result.scalars().all()
-
-    if not meal_plans:
-        return []
-
-    recipe_ids = [mp.recipe_id for mp in meal_plans]
     ingredients_result = await db.execute(
-        select(RecipeIngredient)
-        .where(RecipeIngredient.recipe_id.in_(recipe_ids))
+        select(
+            func.max(RecipeIngredient.ingredient_id).label("ingredient_id"),
+            func.min(RecipeIngredient.name).label("name"),
+            func.sum(RecipeIngredient.quantity * planned.c.scale).label("quantity"),
+            RecipeIngredient.unit,
+            func.min(RecipeIngredient.recipe_id).label("added_from_recipe_id"),
+        )
+        .join(planned, planned.c.recipe_id == RecipeIngredient.recipe_id)
+        .group_by(ingredient_key, RecipeIngredient.unit)
     )
-    recipe_ingredients = ingredients_result.scalars().all()
+    needed = ingredients_result.mappings().all()
 
-    if not recipe_ingredients:
+    if not needed:
         return []
 
     # Get or create active shopping cart
@@ -167,23 +180,14 @@ async def generate_shopping_list(
         db.add(cart)
         await db.flush()
 
-    added_items: list[dict[str, str | float | None]] = []
-    for ri in recipe_ingredients:
-        item = ShoppingCartItem(
-            cart_id=cart.id,
-            ingredient_id=ri.ingredient_id,
-            name=ri.name,
-            quantity=ri.quantity,
-            unit=ri.unit,
-            added_from_recipe_id=ri.recipe_id,
-        )
-        db.add(item)
-        added_items.append({
-            "name": ri.name,
-            "quantity": ri.quantity,
-            "unit": ri.unit,
-            "recipe_id": ri.recipe_id,
-        })
-
-    await db.flush()
-    return added_items
+    # One executemany INSERT instead of a unit-of-work INSERT per ingredient
+    await db.execute(insert(ShoppingCartItem), [{"cart_id": cart.id, **row} for row in needed])
+    return [
+        {
+            "name": row["name"],
+            "quantity": row["quantity"],
+            "unit": row["unit"],
+            "recipe_id": row["added_from_recipe_id"],
+        }
+        for row in needed
+    ]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, func, select
+from pydantic import TypeAdapter
+from sqlalchemy import delete, exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 from app.api.deps import get_current_user, get_user_household_id
-from app.database import get_db
+from app.database import get_db, insert_where
 from app.models.recipe import Recipe, RecipeRating, UserFavorite
 from app.models.user import User
 from app.schemas.recipe import (
@@ -16,10 +17,18 @@ from app.schemas.recipe import (
     RecipeResponse,
     RecipeSearchRequest,
     RecipeSearchResponse,
+    RecipeSummaryResponse,
 )
+from app.services.recipe import search_recipes_with_ai
 
 router = APIRouter()
 
+_SUMMARY_LIST = TypeAdapter(list[RecipeSummaryResponse])
+# Only the columns RecipeSummaryResponse reads; instructions and description stay in the table
+_SUMMARY_COLUMNS = tuple(
+    getattr(Recipe, name) for name in RecipeSummaryResponse.model_fields if name != "is_favorite"
+)
+
 
 @router.post("/search", response_model=RecipeSearchResponse)
 async def search_recipes(
@@ -28,8 +37,6 @@ async def search_recipes(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> RecipeSearchResponse:
-    from app.services.recipe import search_recipes_with_ai
-
     return await search_recipes_with_ai(
         prompt=search.prompt,
         user_id=current_user.id,
@@ -49,17 +56,8 @@ async def get_recipe(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> RecipeResponse:
-    # Query 1: Recipe with eagerly loaded ingredients
-    result = await db.execute(
-        select(Recipe)
-        .where(Recipe.id == recipe_id)
-        .options(selectinload(Recipe.recipe_ingredients))
-    )
-    recipe = result.scalar_one_or_none()
-    if recipe is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    # Query 2: Combine avg rating, user rating, and favorite status into one query
+    # Rating and favorite lookups ride along as scalar subqueries on the recipe SELECT;
+    # selectinload adds one more query for the ingredients.
     avg_rating_subq = (
         select(func.avg(RecipeRating.score))
         .where(RecipeRating.recipe_id == recipe_id)
@@ -76,7 +74,7 @@ async def get_recipe(
         .scalar_subquery()
     )
     fav_subq = (
-        select(func.count(UserFavorite.id))
+        select(func.count())
         .where(
             UserFavorite.recipe_id == recipe_id,
             UserFavorite.user_id == current_user.id,
@@ -84,44 +82,21 @@ async def get_recipe(
         .correlate(None)
         .scalar_subquery()
     )
-    meta_result = await db.execute(
-        select(avg_rating_subq, user_rating_subq, fav_subq)
+    result = await db.execute(
+        select(Recipe, avg_rating_subq, user_rating_subq, fav_subq)
+        .where(Recipe.id == recipe_id)
+        .options(selectinload(Recipe.recipe_ingredients), raiseload("*"))
     )
-    row = meta_result.one()
-    avg_rating, user_rating, fav_count = row[0], row[1], row[2]
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
+    recipe, avg_rating, user_rating, fav_count = row
 
-    ingredients = [
-        {
-            "name": ri.name,
-            "quantity": ri.quantity,
-            "unit": ri.unit,
-            "is_optional": ri.is_optional,
-            "substitution_notes": ri.substitution_notes,
-        }
-        for ri in recipe.recipe_ingredients
-    ]
-
-    return RecipeResponse(
-        id=recipe.id,
-        title=recipe.title,
-        description=recipe.description,
-        instructions=recipe.instructions,
-        cuisine=recipe.cuisine,
-        meal_type=recipe.meal_type,
-        prep_time_minutes=recipe.prep_time_minutes,
-        cook_time_minutes=recipe.cook_time_minutes,
-        servings=recipe.servings,
-        difficulty=recipe.difficulty,
-        image_url=recipe.image_url,
-        source=recipe.source,
-        dietary_tags=recipe.dietary_tags,
-        calorie_estimate=recipe.calorie_estimate,
-        created_at=recipe.created_at,
-        recipe_ingredients=ingredients,
-        average_rating=float(avg_rating) if avg_rating else None,
-        user_rating=user_rating,
-        is_favorite=fav_count > 0,
-    )
+    response = RecipeResponse.model_validate(recipe)
+    response.average_rating = float(avg_rating) if avg_rating else None
+    response.user_rating = user_rating
+    response.is_favorite = fav_count > 0
+    return response
 
 
 @router.post("/{recipe_id}/rate", response_model=RecipeRatingResponse)
@@ -131,32 +106,24 @@ async def rate_recipe(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> RecipeRating:
-    result = await db.execute(select(Recipe).where(Recipe.id == recipe_id))
-    if result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    existing = await db.execute(
-        select(RecipeRating).where(
-            RecipeRating.recipe_id == recipe_id,
-            RecipeRating.user_id == current_user.id,
-        )
+    stmt = insert_where(
+        db,
+        RecipeRating,
+        {"recipe_id": recipe_id, "user_id": current_user.id, **rating_data.model_dump()},
+        exists().where(Recipe.id == recipe_id),
     )
-    existing_rating = existing.scalar_one_or_none()
-
-    if existing_rating:
-        existing_rating.score = rating_data.score
-        existing_rating.review = rating_data.review
-        await db.flush()
-        return existing_rating
-
-    rating = RecipeRating(
-        recipe_id=recipe_id,
-        user_id=current_user.id,
-        score=rating_data.score,
-        review=rating_data.review,
+    result = await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["recipe_id", "user_id"],
+            set_={"score": stmt.excluded.score, "review": stmt.excluded.review},
+        )
+        .returning(RecipeRating)
+        # A rating already in this session's identity map must pick up the new score
+        .execution_options(populate_existing=True)
     )
-    db.add(rating)
-    await db.flush()
+    rating = result.scalar_one_or_none()
+    if rating is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
     return rating
 
 
@@ -166,23 +133,21 @@ async def add_favorite(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    result = await db.execute(select(Recipe).where(Recipe.id == recipe_id))
-    if result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
-
-    existing = await db.execute(
-        select(UserFavorite).where(
-            UserFavorite.recipe_id == recipe_id,
-            UserFavorite.user_id == current_user.id,
+    recipe_exists = exists().where(Recipe.id == recipe_id)
+    result = await db.execute(
+        insert_where(
+            db, UserFavorite, {"recipe_id": recipe_id, "user_id": current_user.id}, recipe_exists
         )
+        .on_conflict_do_nothing(index_elements=["user_id", "recipe_id"])
+        .returning(UserFavorite.recipe_id)
     )
-    if existing.scalar_one_or_none():
-        return {"status": "already_favorited"}
-
-    favorite = UserFavorite(recipe_id=recipe_id, user_id=current_user.id)
-    db.add(favorite)
-    await db.flush()
-    return {"status": "favorited"}
+    if result.scalar_one_or_none() is not None:
+        return {"status": "favorited"}
+    # Nothing inserted: either the favorite already exists or the recipe doesn't
+    exists_result = await db.execute(select(recipe_exists))
+    if not exists_result.scalar():
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipe not found")
+    return {"status": "already_favorited"}
 
 
 @router.delete("/{recipe_id}/favorite", status_code=status.HTTP_204_NO_CONTENT)
@@ -195,9 +160,9 @@ async def remove_favorite(
         delete(UserFavorite).where(
             UserFavorite.recipe_id == recipe_id,
             UserFavorite.user_id == current_user.id,
-        )
+        ).returning(UserFavorite.recipe_id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Favorite not found")
 
 
@@ -205,60 +170,62 @@ async def remove_favorite(
 async def get_favorites(
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None, description="next_cursor from the previous page; takes the place of offset"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedFavoritesResponse:
-    count_result = await db.execute(
-        select(func.count())
-        .select_from(UserFavorite)
-        .where(UserFavorite.user_id == current_user.id)
+    total_favorites = (
+        select(func.count()).where(UserFavorite.user_id == current_user.id).scalar_subquery()
     )
-    total = count_result.scalar() or 0
-
-    result = await db.execute(
-        select(Recipe)
+    stmt = (
+        select(Recipe, total_favorites.label("total"))
         .join(UserFavorite, UserFavorite.recipe_id == Recipe.id)
         .where(UserFavorite.user_id == current_user.id)
-        .options(selectinload(Recipe.recipe_ingredients))
-        .order_by(UserFavorite.created_at.desc())
+        .options(load_only(*_SUMMARY_COLUMNS, raiseload=True), raiseload("*"))
+        .order_by(UserFavorite.created_at.desc(), UserFavorite.recipe_id.desc())
         .limit(limit)
-        .offset(offset)
     )
-    recipes = result.scalars().all()
-    items = [
-        RecipeResponse(
-            id=r.id,
-            title=r.title,
-            description=r.description,
-            instructions=r.instructions,
-            cuisine=r.cuisine,
-            meal_type=r.meal_type,
-            prep_time_minutes=r.prep_time_minutes,
-            cook_time_minutes=r.cook_time_minutes,
-            servings=r.servings,
-            difficulty=r.difficulty,
-            image_url=r.image_url,
-            source=r.source,
-            dietary_tags=r.dietary_tags,
-            calorie_estimate=r.calorie_estimate,
-            created_at=r.created_at,
-            recipe_ingredients=[
-                {
-                    "name": ri.name,
-                    "quantity": ri.quantity,
-                    "unit": ri.unit,
-                    "is_optional": ri.is_optional,
-                    "substitution_notes": ri.substitution_notes,
-                }
-                for ri in r.recipe_ingredients
-            ],
-            is_favorite=True,
+    cursor_created_at = (
+        select(UserFavorite.created_at)
+        .where(UserFavorite.user_id == current_user.id, UserFavorite.recipe_id == cursor)
+        .scalar_subquery()
+    )
+    if cursor is None:
+        stmt = stmt.offset(offset)
+    else:
+        # Keyset pagination: resume right after the favorited recipe the cursor names, so
+        # deep pages cost the same as the first instead of scanning past skipped rows
+        stmt = stmt.where(
+            tuple_(UserFavorite.created_at, UserFavorite.recipe_id)
+            < tuple_(cursor_created_at, cursor)
         )
-        for r in recipes
-    ]
+        offset = 0
+
+    result = await db.execute(stmt)
+    rows = result.all()
+    recipes = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif offset == 0 and cursor is None:
+        total = 0
+    elif cursor is None:
+        count_result = await db.execute(select(total_favorites))
+        total = count_result.scalar() or 0
+    else:
+        # An empty page after a cursor is either the end of the list or a stale cursor
+        count_result = await db.execute(select(total_favorites, cursor_created_at))
+        total, cursor_found = count_result.one()
+        if cursor_found is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    items = _SUMMARY_LIST.validate_python(recipes, from_attributes=True)
+    for item in items:
+        item.is_favorite = True
     return PaginatedFavoritesResponse(
         items=items,
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=recipes[-1].id if len(recipes) == limit else None,
     )
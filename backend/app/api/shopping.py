@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.deps import get_current_user, get_user_household_id
 from app.database import get_db
@@ -25,13 +27,13 @@ router = APIRouter()
 async def get_carts(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
-) -> list[ShoppingCart]:
+) -> Sequence[ShoppingCart]:
     result = await db.execute(
         select(ShoppingCart)
         .where(ShoppingCart.household_id == household_id, ShoppingCart.is_active.is_(True))
-        .options(selectinload(ShoppingCart.items))
+        .options(selectinload(ShoppingCart.items), raiseload("*"))
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 @router.post("/", response_model=ShoppingCartResponse, status_code=status.HTTP_201_CREATED)
@@ -40,16 +42,11 @@ async def create_cart(
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
 ) -> ShoppingCart:
-    cart = ShoppingCart(household_id=household_id, name=data.name)
+    # A new cart has no items; starting with an empty collection saves reloading it
+    cart = ShoppingCart(household_id=household_id, name=data.name, items=[])
     db.add(cart)
     await db.flush()
-
-    result = await db.execute(
-        select(ShoppingCart)
-        .where(ShoppingCart.id == cart.id)
-        .options(selectinload(ShoppingCart.items))
-    )
-    return result.scalar_one()
+    return cart
 
 
 @router.post(
@@ -72,15 +69,7 @@ async def add_cart_item(
     if cart_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cart not found")
 
-    item = ShoppingCartItem(
-        cart_id=cart_id,
-        ingredient_id=data.ingredient_id,
-        name=data.name,
-        quantity=data.quantity,
-        unit=data.unit,
-        notes=data.notes,
-        added_from_recipe_id=data.added_from_recipe_id,
-    )
+    item = ShoppingCartItem(cart_id=cart_id, **data.model_dump())
     db.add(item)
     await db.flush()
     return item
@@ -128,9 +117,9 @@ async def remove_cart_item(
         delete(ShoppingCartItem).where(
             ShoppingCartItem.id == item_id,
             ShoppingCartItem.cart_id == cart_id,
-        )
+        ).returning(ShoppingCartItem.id)
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
 
 
@@ -140,7 +129,7 @@ async def add_missing_ingredients(
     _current_user: User = Depends(get_current_user),
     household_id: str = Depends(get_user_household_id),
     db: AsyncSession = Depends(get_db),
-) -> list[ShoppingCartItem]:
+) -> Sequence[ShoppingCartItem]:
     result = await db.execute(
         select(ShoppingCart).where(
             ShoppingCart.household_id == household_id,
@@ -154,15 +143,14 @@ async def add_missing_ingredients(
         db.add(cart)
         await db.flush()
 
-    items: list[ShoppingCartItem] = []
-    for name in data.ingredient_names:
-        item = ShoppingCartItem(
-            cart_id=cart.id,
-            name=name,
-            added_from_recipe_id=data.recipe_id,
-        )
-        db.add(item)
-        items.append(item)
+    if not data.ingredient_names:
+        return []
 
-    await db.flush()
-    return items
+    result = await db.scalars(
+        insert(ShoppingCartItem).returning(ShoppingCartItem, sort_by_parameter_order=True),
+        [
+            {"cart_id": cart.id, "name": name, "added_from_recipe_id": data.recipe_id}
+            for name in data.ingredient_names
+        ],
+    )
+    return result.all()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -12,18 +15,54 @@ from app.schemas.user import (
     DietaryPreferenceResponse,
     HealthGoalCreate,
     HealthGoalResponse,
+    UserProfileResponse,
     UserResponse,
     UserUpdate,
 )
 
 router = APIRouter()
 
+# Built once at import so each request only binds values; the compiled SQL is reused from
+# the engine's statement cache without rebuilding the construct or its cache key
+_SELECT_PREFERENCES = select(DietaryPreference).where(
+    DietaryPreference.user_id == bindparam("user_id")
+)
+_DELETE_PREFERENCE = (
+    delete(DietaryPreference)
+    .where(DietaryPreference.id == bindparam("item_id"))
+    .where(DietaryPreference.user_id == bindparam("user_id"))
+    .returning(DietaryPreference.id)
+)
+_SELECT_GOALS = select(HealthGoal).where(HealthGoal.user_id == bindparam("user_id"))
+_DELETE_GOAL = (
+    delete(HealthGoal)
+    .where(HealthGoal.id == bindparam("item_id"))
+    .where(HealthGoal.user_id == bindparam("user_id"))
+    .returning(HealthGoal.id)
+)
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
+@router.get("/me/profile", response_model=UserProfileResponse)
+async def get_profile(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Return the user with their dietary preferences and health goals in one response."""
+    params = {"user_id": current_user.id}
+    preferences = await db.execute(_SELECT_PREFERENCES, params)
+    goals = await db.execute(_SELECT_GOALS, params)
+    return {
+        "user": current_user,
+        "dietary_preferences": preferences.scalars().all(),
+        "health_goals": goals.scalars().all(),
+    }
+
+
 @router.patch("/me", response_model=UserResponse)
 async def update_me(
     update_data: UserUpdate,
@@ -42,11 +81,9 @@ async def update_me(
 async def get_dietary_preferences(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[DietaryPreference]:
-    result = await db.execute(
-        select(DietaryPreference).where(DietaryPreference.user_id == current_user.id)
-    )
-    return list(result.scalars().all())
+) -> Sequence[DietaryPreference]:
+    result = await db.execute(_SELECT_PREFERENCES, {"user_id": current_user.id})
+    return result.scalars().all()
 
 
 @router.post(
@@ -59,12 +96,7 @@ async def add_dietary_preference(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> DietaryPreference:
-    pref = DietaryPreference(
-        user_id=current_user.id,
-        preference_type=pref_data.preference_type,
-        value=pref_data.value,
-        notes=pref_data.notes,
-    )
+    pref = DietaryPreference(user_id=current_user.id, **pref_data.model_dump())
     db.add(pref)
     await db.flush()
     return pref
@@ -77,12 +109,9 @@ async def remove_dietary_preference(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     result = await db.execute(
-        delete(DietaryPreference).where(
-            DietaryPreference.id == pref_id,
-            DietaryPreference.user_id == current_user.id,
-        )
+        _DELETE_PREFERENCE, {"item_id": pref_id, "user_id": current_user.id}
     )
-    if result.rowcount == 0:
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Preference not found")
 
 
@@ -90,11 +119,9 @@ async def remove_dietary_preference(
 async def get_health_goals(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[HealthGoal]:
-    result = await db.execute(
-        select(HealthGoal).where(HealthGoal.user_id == current_user.id)
-    )
-    return list(result.scalars().all())
+) -> Sequence[HealthGoal]:
+    result = await db.execute(_SELECT_GOALS, {"user_id": current_user.id})
+    return result.scalars().all()
 
 
 @router.post(
@@ -107,12 +134,7 @@ async def add_health_goal(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> HealthGoal:
-    goal = HealthGoal(
-        user_id=current_user.id,
-        goal_type=goal_data.goal_type,
-        description=goal_data.description,
-        target_value=goal_data.target_value,
-    )
+    goal = HealthGoal(user_id=current_user.id, **goal_data.model_dump())
     db.add(goal)
     await db.flush()
     return goal
@@ -124,11 +146,6 @@ async def remove_health_goal(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> None:
-    result = await db.execute(
-        delete(HealthGoal).where(
-            HealthGoal.id == goal_id,
-            HealthGoal.user_id == current_user.id,
-        )
-    )
-    if result.rowcount == 0:
+    result = await db.execute(_DELETE_GOAL, {"item_id": goal_id, "user_id": current_user.id})
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Health goal not found")
@@ -47,19 +47,52 @@ class Settings(BaseSettings):
     debug: bool = False
     secret_key: str = "change-me-in-production"
     allowed_origins: list[str] = ["http://localhost:6001"]
+    # Serve /docs, /redoc and /openapi.json; turn off in production to skip schema generation
+    api_docs_enabled: bool = True
 
     # Server
     host: str = "0.0.0.0"  # noqa: S104
     port: int = 6000
+    # Uvicorn worker processes for python -m app; 0 starts one per CPU, but only against a
+    # server database with db_create_tables off, since each worker runs init_db on startup
+    # and the login and AI reply caches are per process
+    workers: int = 1
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./companis.db"
+    # Create missing tables at startup; turn off once Alembic manages the schema
+    db_create_tables: bool = True
+    # Connection pool (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    # Set when connecting through a transaction-mode pooler such as PgBouncer: the app then
+    # opens a connection per checkout and asyncpg keeps no prepared statements
+    db_external_pooler: bool = False
+    # Compiled-SQL cache shared by all connections, and asyncpg's per-connection
+    # prepared statement cache (only used with postgresql+asyncpg)
+    db_query_cache_size: int = 1200
+    db_prepared_statement_cache_size: int = 500
 
     # JWT
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 30
 
+    # Password hashing. Changing the pepper invalidates every stored password.
+    password_pepper: str = ""
+    bcrypt_rounds: int = 12
+
+    # Login cache (successful email/password pairs skip bcrypt for a short window)
+    login_cache_ttl_seconds: int = 30
+    login_cache_max_size: int = 10_000
+
+    # AI reply cache (identical substitution, voice and image requests reuse the last reply)
+    ai_cache_ttl_seconds: int = 3600
+    ai_cache_max_size: int = 1000
+
     # OAuth2
     google_client_id: str = ""
     google_client_secret: str = ""
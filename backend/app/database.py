@@ -1,13 +1,68 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import ColumnElement, Select, event, func, literal, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    url = make_url(database_url)
+    options: dict[str, Any] = {"query_cache_size": settings.db_query_cache_size}
+    # SQLite is an in-process file; pool sizing and liveness checks only matter for servers
+    if url.get_backend_name() == "sqlite":
+        return options
+    if settings.db_external_pooler:
+        # Pooling twice would pin the pooler's server connections to idle app-side slots
+        options["poolclass"] = NullPool
+        if url.get_driver_name() == "asyncpg":
+            # Statements prepared on one server connection aren't there on the next
+            options["connect_args"] = {"prepared_statement_cache_size": 0}
+        return options
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        }
+    return options
+
+
+# WAL lets reads run alongside a write, NORMAL sync is still crash-safe under WAL, and a
+# 64 MB page cache, in-memory temp tables and a 256 MB memory map keep hot data off the disk
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "cache_size=-64000",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+engine = create_async_engine(
+    settings.database_url, echo=settings.debug, **_engine_options(settings.database_url)
+)
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -26,5 +81,60 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
+    if not settings.db_create_tables:
+        return
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+
+
+def upsert_insert(db: AsyncSession, model: type[Base]) -> postgresql.Insert | sqlite.Insert:
+    """Return a dialect-specific INSERT that supports ``ON CONFLICT`` clauses."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def insert_where(
+    db: AsyncSession,
+    model: type[Base],
+    values: dict[str, Any],
+    *conditions: ColumnElement[bool],
+) -> postgresql.Insert | sqlite.Insert:
+    """Insert one row of ``values`` only when ``conditions`` hold.
+
+    Renders as ``INSERT ... SELECT <values> WHERE <conditions>`` so guards such as a
+    parent row existing are checked by the same statement that writes. Column defaults
+    fill in anything not given in ``values``; ``RETURNING`` yields no row when a guard
+    fails.
+    """
+    columns = model.__table__.c
+    return upsert_insert(db, model).from_select(
+        list(values),
+        select(*(literal(value, columns[key].type) for key, value in values.items())).where(
+            *conditions
+        ),
+    )
+
+
+async def fetch_page(
+    db: AsyncSession, stmt: Select[Any], limit: int, offset: int
+) -> tuple[list[Any], int]:
+    """Fetch one page of ``stmt`` plus the unpaginated total in a single query.
+
+    The total rides along on every row as ``COUNT(*) OVER ()``. Only when the
+    page comes back empty past the first page is a separate COUNT issued.
+    """
+    result = await db.execute(
+        stmt.add_columns(func.count().over().label("total")).limit(limit).offset(offset)
+    )
+    rows = result.all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if offset == 0:
+        return [], 0
+    count_result = await db.execute(
+        select(func.count()).select_from(stmt.order_by(None).subquery())
+    )
+    return [], count_result.scalar() or 0
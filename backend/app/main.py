@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -18,12 +20,20 @@ from app.api.shopping import router as shopping_router
 from app.api.users import router as users_router
 from app.config import settings
 from app.database import init_db
+from app.services.ai import close_ai_clients
+from app.services.http_client import close_http_client
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    # Password hashing runs in the threadpool; anyio's default of 40 threads is
+    # too small to keep a burst of logins from queueing on multi-core hosts.
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, (os.cpu_count() or 1) * 4)
     await init_db()
     yield
+    await close_ai_clients()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -31,6 +41,8 @@ app = FastAPI(
     version="0.1.0",
     description="AI-powered recipe assistant that helps you cook with what you have",
     lifespan=lifespan,
+    # Without a schema URL FastAPI also skips the /docs and /redoc pages
+    openapi_url="/openapi.json" if settings.api_docs_enabled else None,
 )
 
 app.add_middleware(
@@ -41,16 +53,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users_router, prefix="/api/users", tags=["Users"])
-app.include_router(ingredients_router, prefix="/api/ingredients", tags=["Ingredients"])
-app.include_router(recipes_router, prefix="/api/recipes", tags=["Recipes"])
-app.include_router(household_router, prefix="/api/household", tags=["Household"])
-app.include_router(shopping_router, prefix="/api/shopping", tags=["Shopping"])
-app.include_router(meal_plan_router, prefix="/api/meal-plan", tags=["Meal Plan"])
-app.include_router(cooking_history_router, prefix="/api/cooking-history", tags=["Cooking History"])
-app.include_router(collections_router, prefix="/api/collections", tags=["Collections"])
-app.include_router(ai_router, prefix="/api/ai", tags=["AI"])
+ROUTERS = (
+    (auth_router, "/api/auth", "Authentication"),
+    (users_router, "/api/users", "Users"),
+    (ingredients_router, "/api/ingredients", "Ingredients"),
+    (recipes_router, "/api/recipes", "Recipes"),
+    (household_router, "/api/household", "Household"),
+    (shopping_router, "/api/shopping", "Shopping"),
+    (meal_plan_router, "/api/meal-plan", "Meal Plan"),
+    (cooking_history_router, "/api/cooking-history", "Cooking History"),
+    (collections_router, "/api/collections", "Collections"),
+    (ai_router, "/api/ai", "AI"),
+)
+
+for router, prefix, tag in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=[tag])
 
 
 @app.get("/api/health")
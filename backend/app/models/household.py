@@ -24,6 +24,7 @@ class Household(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    owner: Mapped[User | None] = relationship()  # noqa: F821
     members: Mapped[list[FamilyMember]] = relationship(
         back_populates="household", cascade="all, delete-orphan"
     )
@@ -40,7 +41,7 @@ class FamilyMember(Base):
         String(36), ForeignKey("households.id", ondelete="CASCADE"), nullable=False, index=True
     )
     user_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[str] = mapped_column(String(50), default="member")
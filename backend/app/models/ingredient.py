@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -25,6 +25,16 @@ class Ingredient(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
+    # Trigram GIN index lets PostgreSQL serve `name ILIKE '%q%'` from an index
+    __table_args__ = (
+        Index(
+            "ix_ingredients_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     household_ingredients: Mapped[list[HouseholdIngredient]] = relationship(
         back_populates="ingredient"
     )
@@ -38,7 +48,7 @@ class HouseholdIngredient(Base):
         String(36), ForeignKey("households.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ingredient_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False
+        String(36), ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False, index=True
     )
     quantity: Mapped[float | None] = mapped_column(Float, nullable=True)
     unit: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -14,12 +14,12 @@ class MealPlan(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     household_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("households.id", ondelete="CASCADE"), nullable=False, index=True
+        String(36), ForeignKey("households.id", ondelete="CASCADE"), nullable=False
     )
     recipe_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    meal_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    meal_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     meal_type: Mapped[str] = mapped_column(String(20), nullable=False)  # breakfast, lunch, dinner, snack
     servings: Mapped[int] = mapped_column(Integer, default=2)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -27,9 +27,11 @@ class MealPlan(Base):
         String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
 
+    # Serves the per-household date range reads and their ORDER BY, and as a household_id
+    # prefix also the FK lookups, so neither column needs an index of its own
     __table_args__ = (
         Index("idx_meal_plan_date_type", "household_id", "meal_date", "meal_type"),
     )
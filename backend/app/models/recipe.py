@@ -46,7 +46,7 @@ class RecipeIngredient(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     recipe_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False
+        String(36), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ingredient_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("ingredients.id", ondelete="SET NULL"), nullable=True
@@ -76,7 +76,11 @@ class RecipeRating(Base):
         DateTime(timezone=True), server_default=func.now()
     )
 
-    __table_args__ = (Index("idx_recipe_user_rating", "recipe_id", "user_id"),)
+    __table_args__ = (
+        Index("idx_recipe_user_rating", "recipe_id", "user_id", unique=True),
+        # Covers AVG(score) per recipe so it can be answered from the index alone
+        Index("idx_recipe_rating_score", "recipe_id", "score"),
+    )
 
     recipe: Mapped[Recipe] = relationship(back_populates="ratings")
     user: Mapped[User] = relationship(back_populates="ratings")  # noqa: F821
@@ -85,18 +89,20 @@ class RecipeRating(Base):
 class UserFavorite(Base):
     __tablename__ = "user_favorites"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # A pure join table: the composite key is both the uniqueness rule and the lookup index
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
     recipe_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False
+        String(36), ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
 
-    __table_args__ = (UniqueConstraint("recipe_id", "user_id", name="uq_user_recipe_favorite"),)
+    __table_args__ = (
+        Index("idx_user_favorite_user_created", "user_id", "created_at", "recipe_id"),
+    )
 
     user: Mapped[User] = relationship(back_populates="favorites")  # noqa: F821
     recipe: Mapped[Recipe] = relationship(back_populates="favorites")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -25,6 +25,16 @@ class ShoppingCart(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    # Only active carts are ever looked up by household; the predicate matches the
+    # rendered `is_active IS true` so PostgreSQL can use the partial index.
+    __table_args__ = (
+        Index(
+            "ix_shopping_carts_household_active",
+            "household_id",
+            postgresql_where=text("is_active IS TRUE"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
     items: Mapped[list[ShoppingCartItem]] = relationship(
         back_populates="cart", cascade="all, delete-orphan"
     )
@@ -35,7 +45,7 @@ class ShoppingCartItem(Base):
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     cart_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("shopping_carts.id", ondelete="CASCADE"), nullable=False
+        String(36), ForeignKey("shopping_carts.id", ondelete="CASCADE"), nullable=False, index=True
     )
     ingredient_id: Mapped[str | None] = mapped_column(
         String(36), ForeignKey("ingredients.id", ondelete="SET NULL"), nullable=True
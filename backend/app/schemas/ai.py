@@ -27,3 +27,6 @@ class SubstitutionResponse(BaseModel):
     substitute: str
     notes: str | None = None
     ratio: str | None = None
+
+
+VoiceInputResponse.model_rebuild()
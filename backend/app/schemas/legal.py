@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+
 from pydantic import BaseModel
 
 TERMS_AND_CONDITIONS = """
@@ -89,3 +91,10 @@ class TermsAcceptance(BaseModel):
 class TermsResponse(BaseModel):
     terms_text: str
     version: str
+
+
+# The terms never change at runtime, so the response body and its ETag are built once
+TERMS_JSON = (
+    TermsResponse(terms_text=TERMS_AND_CONDITIONS, version="1.0").model_dump_json().encode()
+)
+TERMS_ETAG = f'"{hashlib.sha256(TERMS_JSON).hexdigest()[:32]}"'
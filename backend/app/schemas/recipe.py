@@ -14,6 +14,8 @@ class RecipeIngredientSchema(BaseModel):
     is_available: bool | None = None
     has_substitution: bool | None = None
 
+    model_config = {"from_attributes": True}
+
 
 class RecipeCreate(BaseModel):
     title: str = Field(max_length=500)
@@ -92,8 +94,31 @@ class RecipeRatingResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Card-view fields only; the full recipe with instructions and ingredients comes from
+# GET /recipes/{recipe_id}
+class RecipeSummaryResponse(BaseModel):
+    id: str
+    title: str
+    cuisine: str | None
+    meal_type: str | None
+    prep_time_minutes: int | None
+    cook_time_minutes: int | None
+    servings: int | None
+    difficulty: str | None
+    image_url: str | None
+    dietary_tags: str | None
+    calorie_estimate: int | None
+    is_favorite: bool = False
+
+    model_config = {"from_attributes": True}
+
+
 class PaginatedFavoritesResponse(BaseModel):
-    items: list[RecipeResponse]
+    items: list[RecipeSummaryResponse]
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+RecipeSearchResponse.model_rebuild()
@@ -52,3 +52,6 @@ class ShoppingCartItemUpdate(BaseModel):
 class AddMissingIngredientsRequest(BaseModel):
     recipe_id: str
     ingredient_names: list[str]
+
+
+ShoppingCartResponse.model_rebuild()
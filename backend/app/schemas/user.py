@@ -69,6 +69,12 @@ class HealthGoalResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserProfileResponse(BaseModel):
+    user: UserResponse
+    dietary_preferences: list[DietaryPreferenceResponse]
+    health_goals: list[HealthGoalResponse]
+
+
 class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
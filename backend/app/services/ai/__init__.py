@@ -1,31 +1,40 @@
 from __future__ import annotations
 
 from app.config import AIProvider, settings
+from app.services.ai import anthropic, ollama, openai_service
+from app.services.ai.anthropic import AnthropicService
 from app.services.ai.base import AIService
+from app.services.ai.claude_local import ClaudeLocalService
+from app.services.ai.ollama import OllamaService
+from app.services.ai.openai_service import OpenAIService
+
+_PROVIDERS: dict[AIProvider, type[AIService]] = {
+    AIProvider.OLLAMA: OllamaService,
+    AIProvider.ANTHROPIC: AnthropicService,
+    AIProvider.CLAUDE_LOCAL: ClaudeLocalService,
+    AIProvider.OPENAI: OpenAIService,
+}
 
 
 def get_ai_service() -> AIService:
     provider = settings.ai_provider
+    service_class = _PROVIDERS.get(provider)
+    if service_class is None:
+        msg = f"Unknown AI provider: {provider}"
+        raise ValueError(msg)
+    return service_class()
 
-    if provider == AIProvider.OLLAMA:
-        from app.services.ai.ollama import OllamaService
-
-        return OllamaService()
-    if provider == AIProvider.ANTHROPIC:
-        from app.services.ai.anthropic import AnthropicService
-
-        return AnthropicService()
-    if provider == AIProvider.CLAUDE_LOCAL:
-        from app.services.ai.claude_local import ClaudeLocalService
-
-        return ClaudeLocalService()
-    if provider == AIProvider.OPENAI:
-        from app.services.ai.openai_service import OpenAIService
 
-        return OpenAIService()
+async def close_ai_clients() -> None:
+    """Close the provider clients that were opened.
 
-    msg = f"Unknown AI provider: {provider}"
-    raise ValueError(msg)
+    Each provider module keeps one client per process (its ``get_client``) so HTTP
+    connections are reused across requests instead of rebuilt per service instance.
+    """
+    for get_client in (anthropic.get_client, ollama.get_client, openai_service.get_client):
+        if get_client.cache_info().currsize:
+            await get_client().close()
+            get_client.cache_clear()
 
 
-__all__ = ["AIService", "get_ai_service"]
+__all__ = ["AIService", "close_ai_clients", "get_ai_service"]
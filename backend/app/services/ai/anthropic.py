@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 import anthropic
@@ -9,9 +10,14 @@ from app.config import settings
 from app.services.ai.base import AIService
 
 
+@lru_cache(maxsize=1)
+def get_client() -> anthropic.AsyncAnthropic:
+    return anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+
+
 class AnthropicService(AIService):
     def __init__(self) -> None:
-        self.client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = get_client()
         self.model = settings.anthropic_model
 
     async def generate_recipes(
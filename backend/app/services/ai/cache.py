@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.config import settings
+from app.utils.cache import TTLCache
+
+# Provider replies keyed by ai_cache_key(). Voice transcripts, substitution lookups and
+# re-sent photos repeat often, and each miss costs seconds of model latency.
+ai_response_cache: TTLCache[Any] = TTLCache(
+    maxsize=settings.ai_cache_max_size, ttl=settings.ai_cache_ttl_seconds
+)
+
+
+def ai_cache_key(method: str, **payload: Any) -> bytes:
+    """Key a call on the active provider, the method name and its exact inputs."""
+    material = json.dumps([settings.ai_provider, method, payload], sort_keys=True)
+    return hashlib.blake2b(material.encode(), digest_size=16).digest()
+
+
+async def cached_ai_call[T](key: bytes, call: Callable[[], Awaitable[T]]) -> T:
+    """Return the cached reply for ``key``, or await ``call`` and cache its result.
+
+    Failures aren't cached. Callers get their own copy so mutating a reply can't change
+    what later hits see.
+    """
+    cached = ai_response_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+    result = await call()
+    ai_response_cache.set(key, copy.deepcopy(result))
+    return result
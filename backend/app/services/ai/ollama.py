@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from ollama import AsyncClient
@@ -9,9 +10,14 @@ from app.config import settings
 from app.services.ai.base import AIService
 
 
+@lru_cache(maxsize=1)
+def get_client() -> AsyncClient:
+    return AsyncClient(host=settings.ollama_base_url)
+
+
 class OllamaService(AIService):
     def __init__(self) -> None:
-        self.client = AsyncClient(host=settings.ollama_base_url)
+        self.client = get_client()
         self.model = settings.ollama_model
 
     async def generate_recipes(
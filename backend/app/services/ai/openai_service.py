@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -9,9 +10,14 @@ from app.config import settings
 from app.services.ai.base import AIService
 
 
+@lru_cache(maxsize=1)
+def get_client() -> AsyncOpenAI:
+    return AsyncOpenAI(api_key=settings.openai_api_key)
+
+
 class OpenAIService(AIService):
     def __init__(self) -> None:
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self.client = get_client()
         self.model = settings.openai_model
 
     async def generate_recipes(
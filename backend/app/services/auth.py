@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
+from jose import JWTError, jwt
 
 from app.config import settings
+from app.services.http_client import get_http_client
 
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
 
 FACEBOOK_AUTH_URL = "https://www.facebook.com/v18.0/dialog/oauth"
 FACEBOOK_TOKEN_URL = "https://graph.facebook.com/v18.0/oauth/access_token"
@@ -51,66 +53,95 @@ async def get_oauth_user_info(provider: str, code: str) -> dict[str, Any] | None
 
 
 async def _get_google_user_info(code: str, redirect_uri: str) -> dict[str, Any] | None:
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "code": code,
-                "client_id": settings.google_client_id,
-                "client_secret": settings.google_client_secret,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code",
-            },
-        )
-        if token_resp.status_code != 200:
-            return None
-
-        access_token = token_resp.json().get("access_token")
-        user_resp = await client.get(
-            GOOGLE_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        if user_resp.status_code != 200:
-            return None
-
-        data = user_resp.json()
-        return {
-            "id": data["id"],
-            "email": data["email"],
-            "name": data.get("name", ""),
-            "avatar_url": data.get("picture"),
-        }
+    client = get_http_client()
+    token_resp = await client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": settings.google_client_id,
+            "client_secret": settings.google_client_secret,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code",
+        },
+    )
+    if token_resp.status_code != 200:
+        return None
+
+    tokens = token_resp.json()
+    user_info = _google_id_token_user_info(tokens.get("id_token"))
+    if user_info is not None:
+        return user_info
+
+    access_token = tokens.get("access_token")
+    user_resp = await client.get(
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    if user_resp.status_code != 200:
+        return None
+
+    data = user_resp.json()
+    return {
+        "id": data["id"],
+        "email": data["email"],
+        "name": data.get("name", ""),
+        "avatar_url": data.get("picture"),
+    }
+
+
+def _google_id_token_user_info(id_token: str | None) -> dict[str, Any] | None:
+    # The openid scope puts a signed ID token in the token response. It came straight from
+    # Google's token endpoint over TLS, so per Google's OpenID Connect guide its claims can
+    # be read without checking the signature, saving the userinfo round trip.
+    if not id_token:
+        return None
+    try:
+        claims = jwt.get_unverified_claims(id_token)
+    except JWTError:
+        return None
+    if (
+        claims.get("aud") != settings.google_client_id
+        or claims.get("iss") not in GOOGLE_ISSUERS
+        or not claims.get("email")
+    ):
+        return None
+    return {
+        "id": claims["sub"],
+        "email": claims["email"],
+        "name": claims.get("name", ""),
+        "avatar_url": claims.get("picture"),
+    }
 
 
 async def _get_facebook_user_info(code: str, redirect_uri: str) -> dict[str, Any] | None:
-    async with httpx.AsyncClient() as client:
-        token_resp = await client.get(
-            FACEBOOK_TOKEN_URL,
-            params={
-                "code": code,
-                "client_id": settings.facebook_client_id,
-                "client_secret": settings.facebook_client_secret,
-                "redirect_uri": redirect_uri,
-            },
-        )
-        if token_resp.status_code != 200:
-            return None
-
-        access_token = token_resp.json().get("access_token")
-        user_resp = await client.get(
-            FACEBOOK_USERINFO_URL,
-            params={
-                "fields": "id,name,email,picture",
-                "access_token": access_token,
-            },
-        )
-        if user_resp.status_code != 200:
-            return None
-
-        data = user_resp.json()
-        return {
-            "id": data["id"],
-            "email": data.get("email", ""),
-            "name": data.get("name", ""),
-            "avatar_url": data.get("picture", {}).get("data", {}).get("url"),
-        }
+    client = get_http_client()
+    token_resp = await client.get(
+        FACEBOOK_TOKEN_URL,
+        params={
+            "code": code,
+            "client_id": settings.facebook_client_id,
+            "client_secret": settings.facebook_client_secret,
+            "redirect_uri": redirect_uri,
+        },
+    )
+    if token_resp.status_code != 200:
+        return None
+
+    access_token = token_resp.json().get("access_token")
+    user_resp = await client.get(
+        FACEBOOK_USERINFO_URL,
+        params={
+            "fields": "id,name,email,picture",
+            "access_token": access_token,
+        },
+    )
+    if user_resp.status_code != 200:
+        return None
+
+    data = user_resp.json()
+    return {
+        "id": data["id"],
+        "email": data.get("email", ""),
+        "name": data.get("name", ""),
+        "avatar_url": data.get("picture", {}).get("data", {}).get("url"),
+    }
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.models.ingredient import Ingredient
 from app.schemas.ingredient import BarcodeScanResult, IngredientResponse
+from app.services.http_client import get_http_client
 
 
 async def lookup_barcode(barcode: str, db: AsyncSession) -> BarcodeScanResult | None:
@@ -48,14 +49,13 @@ async def lookup_barcode(barcode: str, db: AsyncSession) -> BarcodeScanResult |
 
 async def _fetch_openfoodfacts(barcode: str) -> dict | None:
     url = f"{settings.openfoodfacts_api_url}/product/{barcode}"
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(url)
-            if response.status_code != 200:
-                return None
-            data = response.json()
-            if data.get("status") != 1:
-                return None
-            return data.get("product")
-        except httpx.HTTPError:
-            return None
+    try:
+        response = await get_http_client().get(url)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    data = response.json()
+    if data.get("status") != 1:
+        return None
+    return data.get("product")
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Process-wide client for third-party APIs (OAuth providers, OpenFoodFacts).
+
+    Sharing one pool lets repeat calls to the same host skip TCP and TLS setup.
+    """
+    return httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30),
+    )
+
+
+async def close_http_client() -> None:
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from app.schemas.ingredient import CameraScanResult
 from app.services.ai import get_ai_service
+from app.services.ai.cache import ai_cache_key, cached_ai_call
 
 
 async def detect_ingredients_from_image(image_base64: str) -> CameraScanResult:
     ai_service = get_ai_service()
-    result = await ai_service.identify_ingredients_from_image(image_base64)
+    result = await cached_ai_call(
+        ai_cache_key("identify_ingredients_from_image", image_base64=image_base64),
+        lambda: ai_service.identify_ingredients_from_image(image_base64),
+    )
 
     ingredients = result.get("ingredients", [])
     confidence_scores = result.get("confidence_scores", {})
@@ -4,7 +4,7 @@ import logging
 import re
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.household import FamilyMember
@@ -101,7 +101,8 @@ async def search_recipes_with_ai(
                 )
             )
 
-        recipe_response = RecipeResponse(
+        # Every field comes from the row just written, so skip re-validating it
+        recipe_response = RecipeResponse.model_construct(
             id=recipe.id,
             title=recipe.title,
             description=recipe.description,
@@ -173,19 +174,22 @@ async def _save_recipe(
     db.add(recipe)
     await db.flush()
 
+    rows: list[dict[str, Any]] = []
     for ing in raw.get("ingredients", []):
         quantity, unit = _parse_quantity(ing.get("quantity"), ing.get("unit"))
-        recipe_ingredient = RecipeIngredient(
-            recipe_id=recipe.id,
-            name=ing.get("name", ""),
-            quantity=quantity,
-            unit=unit,
-            is_optional=ing.get("is_optional", False),
-            substitution_notes=ing.get("substitution_notes"),
+        rows.append(
+            {
+                "recipe_id": recipe.id,
+                "name": ing.get("name", ""),
+                "quantity": quantity,
+                "unit": unit,
+                "is_optional": ing.get("is_optional", False),
+                "substitution_notes": ing.get("substitution_notes"),
+            }
         )
-        db.add(recipe_ingredient)
-
-    await db.flush()
+    if rows:
+        # One executemany INSERT instead of building an ORM object per ingredient
+        await db.execute(insert(RecipeIngredient), rows)
     return recipe
 
 
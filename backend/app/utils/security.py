@@ -1,41 +1,96 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import hmac
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import bcrypt
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 
 from app.config import settings
+from app.utils.cache import TTLCache
+
+# Maps login_cache_key(email, password) -> access token claims for recently successful
+# logins. Only successes are stored so failed guesses can never poison the cache.
+login_cache: TTLCache[dict[str, str]] = TTLCache(
+    maxsize=settings.login_cache_max_size, ttl=settings.login_cache_ttl_seconds
+)
+
+
+def login_cache_key(email: str, password: str) -> bytes:
+    """Derive a cache key that never keeps the plaintext password in memory."""
+    return hmac.new(
+        settings.secret_key.encode("utf-8"),
+        f"{email}:{password}".encode(),
+        hashlib.sha256,
+    ).digest()
+
+
+# Marks hashes whose bcrypt input is the peppered pre-hash rather than the raw password
+_PREHASH_PREFIX = "$hmac-sha256"
+
+
+def _prehash(password: str) -> bytes:
+    # HMAC-SHA256 adds the pepper and keeps long passwords from being cut at bcrypt's
+    # 72-byte limit; base64 keeps NUL bytes out of the bcrypt input.
+    digest = hmac.new(
+        settings.password_pepper.encode("utf-8"), password.encode("utf-8"), hashlib.sha256
+    ).digest()
+    return base64.b64encode(digest)
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    hashed = bcrypt.hashpw(_prehash(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds))
+    return _PREHASH_PREFIX + hashed.decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    if hashed_password.startswith(_PREHASH_PREFIX):
+        secret = _prehash(plain_password)
+        expected = hashed_password.removeprefix(_PREHASH_PREFIX).encode("utf-8")
+    else:
+        # Hashes stored before pre-hashing was introduced
+        secret = plain_password.encode("utf-8")
+        expected = hashed_password.encode("utf-8")
+    try:
+        computed = bcrypt.hashpw(secret, expected)
+    except ValueError:
+        return False
+    # Compare the full digests in constant time regardless of the bcrypt backend
+    return hmac.compare_digest(computed, expected)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return not hashed_password.startswith(_PREHASH_PREFIX)
+
+
+# Built once so jose doesn't re-parse the secret into a key object for every token
+_JWT_KEY = jwk.construct(settings.secret_key, settings.jwt_algorithm)
+
+# Checked against when the account doesn't exist so unknown emails cost the same bcrypt
+# round as wrong passwords, without generating a fresh salt and hash per request.
+DUMMY_HASH = hash_password("dummy-unmatchable")
 
 
 def create_access_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _JWT_KEY, algorithm=settings.jwt_algorithm)
 
 
 def create_refresh_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days)
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _JWT_KEY, algorithm=settings.jwt_algorithm)
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
     try:
-        payload: dict[str, Any] = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.jwt_algorithm]
-        )
+        payload: dict[str, Any] = jwt.decode(token, _JWT_KEY, algorithms=[settings.jwt_algorithm])
         return payload
     except JWTError:
         return None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -8,6 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.database import Base, get_db
 from app.main import app
+from app.models.recipe import Recipe, RecipeIngredient
+from app.services.ai.cache import ai_response_cache
+from app.utils.security import login_cache
+
+RecipeFactory = Callable[..., Awaitable[str]]
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
@@ -33,6 +38,8 @@ async def setup_db() -> AsyncGenerator[None, None]:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
+    login_cache.clear()
+    ai_response_cache.clear()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
@@ -42,3 +49,28 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture
+def recipe_factory() -> RecipeFactory:
+    async def create(
+        title: str = "Test Recipe",
+        ingredients: Sequence[tuple[str, float | None, str | None]] = (),
+        servings: int | None = None,
+        instructions: str = "1. Cook it",
+    ) -> str:
+        async with test_session_factory() as session:
+            recipe = Recipe(
+                title=title,
+                instructions=instructions,
+                servings=servings,
+                recipe_ingredients=[
+                    RecipeIngredient(name=name, quantity=quantity, unit=unit)
+                    for name, quantity, unit in ingredients
+                ],
+            )
+            session.add(recipe)
+            await session.commit()
+            return recipe.id
+
+    return create
@@ -1,7 +1,26 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+
+from tests.conftest import engine
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Collect the SQL statements executed while the test runs."""
+    captured: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        captured.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield captured
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
 
 
 @pytest.fixture
@@ -1,7 +1,24 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import bcrypt
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.models.household import FamilyMember
+from app.models.user import User
+from app.utils.security import (
+    DUMMY_HASH,
+    create_access_token,
+    decode_token,
+    login_cache,
+    password_needs_rehash,
+    verify_password,
+)
+from tests.conftest import test_session_factory as session_factory
 
 
 @pytest.mark.asyncio
@@ -90,6 +107,44 @@ class TestAuthFlow:
         )
         assert response.status_code == 401
 
+    async def test_repeated_login_uses_cache(self, client: AsyncClient) -> None:
+        await client.post(
+            "/api/auth/register",
+            json={
+                "email": "cached@example.com",
+                "password": "testpassword123",
+                "full_name": "Cached User",
+                "terms_accepted": True,
+            },
+        )
+        credentials = {"email": "cached@example.com", "password": "testpassword123"}
+        first = await client.post("/api/auth/login", json=credentials)
+        with patch("app.api.auth.verify_password") as mock_verify:
+            second = await client.post("/api/auth/login", json=credentials)
+        mock_verify.assert_not_called()
+        assert first.status_code == 200
+        assert second.status_code == 200
+        me = await client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {second.json()['access_token']}"},
+        )
+        assert me.json()["email"] == "cached@example.com"
+
+    async def test_failed_login_is_not_cached(self, client: AsyncClient) -> None:
+        await client.post(
+            "/api/auth/register",
+            json={
+                "email": "login@example.com",
+                "password": "testpassword123",
+                "full_name": "Login User",
+                "terms_accepted": True,
+            },
+        )
+        credentials = {"email": "login@example.com", "password": "wrongpassword"}
+        await client.post("/api/auth/login", json=credentials)
+        response = await client.post("/api/auth/login", json=credentials)
+        assert response.status_code == 401
+
     async def test_login_nonexistent_user(self, client: AsyncClient) -> None:
         response = await client.post(
             "/api/auth/login",
@@ -97,6 +152,74 @@ class TestAuthFlow:
         )
         assert response.status_code == 401
 
+    async def test_login_nonexistent_user_still_checks_a_hash(self, client: AsyncClient) -> None:
+        with (
+            patch("app.api.auth.hash_password") as mock_hash,
+            patch("app.api.auth.verify_password", return_value=False) as mock_verify,
+        ):
+            response = await client.post(
+                "/api/auth/login",
+                json={"email": "nobody@example.com", "password": "password123"},
+            )
+        assert response.status_code == 401
+        mock_verify.assert_called_once_with("password123", DUMMY_HASH)
+        mock_hash.assert_not_called()
+
+    async def test_login_upgrades_legacy_hash(self, client: AsyncClient) -> None:
+        await client.post(
+            "/api/auth/register",
+            json={
+                "email": "legacy@example.com",
+                "password": "testpassword123",
+                "full_name": "Legacy User",
+                "terms_accepted": True,
+            },
+        )
+        legacy = bcrypt.hashpw(b"testpassword123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        async with session_factory() as session:
+            await session.execute(
+                update(User)
+                .where(User.email == "legacy@example.com")
+                .values(hashed_password=legacy)
+            )
+            await session.commit()
+
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": "legacy@example.com", "password": "testpassword123"},
+        )
+        assert response.status_code == 200
+
+        async with session_factory() as session:
+            result = await session.execute(
+                select(User.hashed_password).where(User.email == "legacy@example.com")
+            )
+            stored = result.scalar_one()
+        assert stored is not None
+        assert not password_needs_rehash(stored)
+        assert verify_password("testpassword123", stored)
+
+    async def test_login_disabled_user(self, client: AsyncClient) -> None:
+        await client.post(
+            "/api/auth/register",
+            json={
+                "email": "disabled@example.com",
+                "password": "testpassword123",
+                "full_name": "Disabled User",
+                "terms_accepted": True,
+            },
+        )
+        async with session_factory() as session:
+            await session.execute(
+                update(User).where(User.email == "disabled@example.com").values(is_active=False)
+            )
+            await session.commit()
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": "disabled@example.com", "password": "testpassword123"},
+        )
+        assert response.status_code == 403
+
     async def test_refresh_token(self, client: AsyncClient) -> None:
         await client.post(
             "/api/auth/register",
@@ -121,6 +244,134 @@ class TestAuthFlow:
         assert "access_token" in data
         assert "refresh_token" in data
 
+    async def test_tokens_carry_household_id(self, client: AsyncClient) -> None:
+        await client.post(
+            "/api/auth/register",
+            json={
+                "email": "hh@example.com",
+                "password": "testpassword123",
+                "full_name": "Household User",
+                "terms_accepted": True,
+            },
+        )
+        login_resp = await client.post(
+            "/api/auth/login",
+            json={"email": "hh@example.com", "password": "testpassword123"},
+        )
+        tokens = login_resp.json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        household = await client.get("/api/household/", headers=headers)
+        household_id = household.json()["id"]
+
+        payload = decode_token(tokens["access_token"])
+        assert payload is not None
+        assert payload["hh"] == household_id
+
+        cached_resp = await client.post(
+            "/api/auth/login",
+            json={"email": "hh@example.com", "password": "testpassword123"},
+        )
+        cached_payload = decode_token(cached_resp.json()["access_token"])
+        assert cached_payload is not None
+        assert cached_payload["hh"] == household_id
+
+        refresh_resp = await client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        refreshed = decode_token(refresh_resp.json()["access_token"])
+        assert refreshed is not None
+        assert refreshed["hh"] == household_id
+
+    async def test_token_without_household_claim_falls_back_to_lookup(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        me = await client.get("/api/users/me", headers=auth_headers)
+        legacy_token = create_access_token({"sub": me.json()["id"]})
+        response = await client.get(
+            "/api/household/", headers={"Authorization": f"Bearer {legacy_token}"}
+        )
+        assert response.status_code == 200
+        assert "Kitchen" in response.json()["name"]
+
+    async def test_login_prefers_owned_household(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+    ) -> None:
+        me = (await client.get("/api/users/me", headers=auth_headers)).json()
+        own = (await client.get("/api/household/", headers=auth_headers)).json()["id"]
+        other = (await client.get("/api/household/", headers=second_user_headers)).json()["id"]
+        # Joined the other household "before" owning one, so creation order alone would pick it
+        async with session_factory() as session:
+            session.add(
+                FamilyMember(
+                    household_id=other,
+                    user_id=me["id"],
+                    name=me["full_name"],
+                    created_at=datetime(2000, 1, 1, tzinfo=UTC),
+                )
+            )
+            await session.commit()
+
+        login_cache.clear()
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": me["email"], "password": "testpassword123"},
+        )
+        payload = decode_token(response.json()["access_token"])
+        assert payload is not None
+        assert payload["hh"] == own
+
+    async def test_household_claim_needs_no_extra_query(
+        self, client: AsyncClient, auth_headers: dict[str, str], statements: list[str]
+    ) -> None:
+        response = await client.get("/api/household/", headers=auth_headers)
+        assert response.status_code == 200
+
+        statements.clear()
+        response = await client.get("/api/household/", headers=auth_headers)
+        assert response.status_code == 200
+        # The user row carries the membership check; the only other query loads the household
+        assert len(statements) == 2
+        assert "FROM users" in statements[0]
+        assert "family_members" in statements[0]
+        assert "family_members" not in statements[1]
+
+    async def test_household_claim_is_rechecked(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+    ) -> None:
+        me = (await client.get("/api/users/me", headers=auth_headers)).json()
+        own = (await client.get("/api/household/", headers=auth_headers)).json()["id"]
+        other = (await client.get("/api/household/", headers=second_user_headers)).json()["id"]
+        forged = create_access_token({"sub": me["id"], "hh": other})
+
+        response = await client.get(
+            "/api/household/", headers={"Authorization": f"Bearer {forged}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["id"] == own
+
+    async def test_household_claim_wins_while_still_a_member(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+    ) -> None:
+        me = (await client.get("/api/users/me", headers=auth_headers)).json()
+        other = (await client.get("/api/household/", headers=second_user_headers)).json()["id"]
+        async with session_factory() as session:
+            session.add(FamilyMember(household_id=other, user_id=me["id"], name=me["full_name"]))
+            await session.commit()
+        token = create_access_token({"sub": me["id"], "hh": other})
+
+        response = await client.get("/api/household/", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert response.json()["id"] == other
+
     async def test_refresh_with_invalid_token(self, client: AsyncClient) -> None:
         response = await client.post(
             "/api/auth/refresh",
@@ -147,3 +398,55 @@ class TestAuthFlow:
             headers={"Authorization": "Bearer invalid.token.here"},
         )
         assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+class TestOAuthCallback:
+    async def test_new_oauth_user_gets_household(self, client: AsyncClient) -> None:
+        user_info = {"id": "g-123", "email": "oauth@example.com", "name": "Oauth User"}
+        with patch(
+            "app.api.auth.get_oauth_user_info", return_value=user_info
+        ) as mock_info:
+            response = await client.post(
+                "/api/auth/oauth/google/callback", params={"code": "abc"}
+            )
+        mock_info.assert_awaited_once()
+        assert response.status_code == 200
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        household = await client.get("/api/household/", headers=headers)
+        assert household.status_code == 200
+        assert household.json()["name"] == "Oauth User's Kitchen"
+
+        members = await client.get("/api/household/members", headers=headers)
+        assert members.status_code == 200
+        assert [m["role"] for m in members.json()] == ["owner"]
+
+    async def test_oauth_user_reuses_existing_account(self, client: AsyncClient) -> None:
+        user_info = {"id": "g-456", "email": "repeat@example.com", "name": "Repeat"}
+        with patch("app.api.auth.get_oauth_user_info", return_value=user_info):
+            first = await client.post("/api/auth/oauth/google/callback", params={"code": "a"})
+            second = await client.post("/api/auth/oauth/google/callback", params={"code": "b"})
+        assert first.status_code == 200
+        assert second.status_code == 200
+        headers = {"Authorization": f"Bearer {second.json()['access_token']}"}
+        members = await client.get("/api/household/members", headers=headers)
+        assert len(members.json()) == 1
+
+
+@pytest.mark.asyncio
+class TestTerms:
+    async def test_terms_with_etag(self, client: AsyncClient) -> None:
+        response = await client.get("/api/auth/terms")
+        assert response.status_code == 200
+        assert response.json()["version"] == "1.0"
+        assert "COMPANIS TERMS OF SERVICE" in response.json()["terms_text"]
+        etag = response.headers["etag"]
+
+        cached = await client.get("/api/auth/terms", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        stale = await client.get("/api/auth/terms", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
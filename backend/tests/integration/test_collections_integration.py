@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import RecipeFactory
+
+
+@pytest.mark.asyncio
+class TestCollections:
+    async def test_create_and_list_collections(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.post(
+            "/api/collections/",
+            json={"name": "Weeknight", "description": "Quick dinners"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+        response = await client.get("/api/collections/", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["name"] == "Weeknight"
+        assert data[0]["description"] == "Quick dinners"
+
+    async def test_list_collections_with_items_does_not_lazy_load(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        for name in ("First", "Second"):
+            create_resp = await client.post(
+                "/api/collections/", json={"name": name}, headers=auth_headers
+            )
+            collection_id = create_resp.json()["id"]
+            add_resp = await client.post(
+                f"/api/collections/{collection_id}/recipes",
+                json={"recipe_id": recipe_id},
+                headers=auth_headers,
+            )
+            assert add_resp.status_code == 201
+
+        response = await client.get("/api/collections/", headers=auth_headers)
+        assert response.status_code == 200
+        assert {c["name"] for c in response.json()} == {"First", "Second"}
+
+    async def test_list_collections_isolated_between_users(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        second_user_headers: dict[str, str],
+    ) -> None:
+        await client.post("/api/collections/", json={"name": "Mine"}, headers=auth_headers)
+        response = await client.get("/api/collections/", headers=second_user_headers)
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_get_collection_with_items(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        create_resp = await client.post(
+            "/api/collections/", json={"name": "Favorites"}, headers=auth_headers
+        )
+        collection_id = create_resp.json()["id"]
+        await client.post(
+            f"/api/collections/{collection_id}/recipes",
+            json={"recipe_id": recipe_id},
+            headers=auth_headers,
+        )
+
+        response = await client.get(f"/api/collections/{collection_id}", headers=auth_headers)
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) == 1
+        assert items[0]["recipe_id"] == recipe_id
+
+    async def test_add_recipe_twice_conflicts(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        create_resp = await client.post(
+            "/api/collections/", json={"name": "Dupes"}, headers=auth_headers
+        )
+        collection_id = create_resp.json()["id"]
+        url = f"/api/collections/{collection_id}/recipes"
+        first = await client.post(url, json={"recipe_id": recipe_id}, headers=auth_headers)
+        assert first.status_code == 201
+        second = await client.post(url, json={"recipe_id": recipe_id}, headers=auth_headers)
+        assert second.status_code == 409
+
+    async def test_cannot_modify_other_users_collection(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        recipe_factory: RecipeFactory,
+        second_user_headers: dict[str, str],
+    ) -> None:
+        recipe_id = await recipe_factory()
+        create_resp = await client.post(
+            "/api/collections/", json={"name": "Private"}, headers=auth_headers
+        )
+        collection_id = create_resp.json()["id"]
+        await client.post(
+            f"/api/collections/{collection_id}/recipes",
+            json={"recipe_id": recipe_id},
+            headers=auth_headers,
+        )
+
+        add_resp = await client.post(
+            f"/api/collections/{collection_id}/recipes",
+            json={"recipe_id": recipe_id},
+            headers=second_user_headers,
+        )
+        assert add_resp.status_code == 404
+        assert add_resp.json()["detail"] == "Collection not found"
+
+        remove_resp = await client.delete(
+            f"/api/collections/{collection_id}/recipes/{recipe_id}",
+            headers=second_user_headers,
+        )
+        assert remove_resp.status_code == 404
+
+        response = await client.get(f"/api/collections/{collection_id}", headers=auth_headers)
+        assert len(response.json()["items"]) == 1
+
+    async def test_remove_recipe_from_collection(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        create_resp = await client.post(
+            "/api/collections/", json={"name": "Temp"}, headers=auth_headers
+        )
+        collection_id = create_resp.json()["id"]
+        await client.post(
+            f"/api/collections/{collection_id}/recipes",
+            json={"recipe_id": recipe_id},
+            headers=auth_headers,
+        )
+        url = f"/api/collections/{collection_id}/recipes/{recipe_id}"
+        assert (await client.delete(url, headers=auth_headers)).status_code == 204
+        assert (await client.delete(url, headers=auth_headers)).status_code == 404
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import RecipeFactory
+
+
+@pytest.mark.asyncio
+class TestCookingHistory:
+    async def test_log_cooked_recipe(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        response = await client.post(
+            "/api/cooking-history/",
+            json={"recipe_id": recipe_id, "servings_made": 2, "notes": "Tasty"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["recipe_id"] == recipe_id
+        assert data["servings_made"] == 2
+        assert data["cooked_at"] is not None
+
+    async def test_log_unknown_recipe(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.post(
+            "/api/cooking-history/",
+            json={"recipe_id": "nonexistent-id"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
+    async def test_get_empty_history(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.get("/api/cooking-history/", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "total": 0, "limit": 20, "offset": 0}
+
+    async def test_history_pagination_total(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        for _ in range(3):
+            await client.post(
+                "/api/cooking-history/", json={"recipe_id": recipe_id}, headers=auth_headers
+            )
+
+        response = await client.get("/api/cooking-history/?limit=2&offset=0", headers=auth_headers)
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["total"] == 3
+
+        response = await client.get("/api/cooking-history/?limit=2&offset=2", headers=auth_headers)
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["total"] == 3
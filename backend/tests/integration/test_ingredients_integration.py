@@ -51,12 +51,42 @@ class TestIngredientCRUD:
             headers=auth_headers,
         )
         assert response.status_code == 200
-        results = response.json()
-        assert len(results) >= 2
-        names = [r["name"] for r in results]
+        data = response.json()
+        assert data["total"] >= 2
+        names = [r["name"] for r in data["items"]]
         assert "Broccoli" in names
         assert "Brown Rice" in names
 
+    async def test_search_ingredients_paginates_with_total(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        for name in ("Apple", "Apricot", "Avocado"):
+            await client.post("/api/ingredients/", json={"name": name}, headers=auth_headers)
+
+        response = await client.get(
+            "/api/ingredients/search?q=a&limit=2&offset=0", headers=auth_headers
+        )
+        data = response.json()
+        assert [r["name"] for r in data["items"]] == ["Apple", "Apricot"]
+        assert data["total"] == 3
+
+        response = await client.get(
+            "/api/ingredients/search?q=a&limit=2&offset=10", headers=auth_headers
+        )
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 3
+
+    async def test_search_single_character_matches_prefix(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        for name in ("Broccoli", "Cabbage"):
+            await client.post("/api/ingredients/", json={"name": name}, headers=auth_headers)
+
+        response = await client.get("/api/ingredients/search?q=b", headers=auth_headers)
+        names = [r["name"] for r in response.json()["items"]]
+        assert names == ["Broccoli"]
+
     async def test_search_ingredients_no_results(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ) -> None:
@@ -65,7 +95,8 @@ class TestIngredientCRUD:
             headers=auth_headers,
         )
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json()["items"] == []
+        assert response.json()["total"] == 0
 
 
 @pytest.mark.asyncio
@@ -75,7 +106,8 @@ class TestHouseholdIngredients:
     ) -> None:
         response = await client.get("/api/ingredients/household", headers=auth_headers)
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json()["items"] == []
+        assert response.json()["total"] == 0
 
     async def test_add_household_ingredient_by_name(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -97,6 +129,34 @@ class TestHouseholdIngredients:
         assert data["source"] == "manual"
         assert data["ingredient"]["name"] == "Sugar"
 
+    async def test_add_household_ingredient_by_id(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        create_resp = await client.post(
+            "/api/ingredients/", json={"name": "Rice"}, headers=auth_headers
+        )
+        ingredient_id = create_resp.json()["id"]
+
+        response = await client.post(
+            "/api/ingredients/household",
+            json={"ingredient_id": ingredient_id, "quantity": 1.0},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["ingredient_id"] == ingredient_id
+        assert data["ingredient"]["name"] == "Rice"
+
+    async def test_add_household_ingredient_unknown_id(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.post(
+            "/api/ingredients/household",
+            json={"ingredient_id": "nonexistent-id"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+
     async def test_add_multiple_household_ingredients(
         self, client: AsyncClient, auth_headers: dict[str, str]
     ) -> None:
@@ -111,7 +171,8 @@ class TestHouseholdIngredients:
             headers=auth_headers,
         )
         response = await client.get("/api/ingredients/household", headers=auth_headers)
-        assert len(response.json()) == 2
+        assert len(response.json()["items"]) == 2
+        assert response.json()["total"] == 2
 
     async def test_update_household_ingredient(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -146,7 +207,7 @@ class TestHouseholdIngredients:
         assert delete_resp.status_code == 204
 
         get_resp = await client.get("/api/ingredients/household", headers=auth_headers)
-        assert len(get_resp.json()) == 0
+        assert len(get_resp.json()["items"]) == 0
 
     async def test_delete_nonexistent_household_ingredient(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -179,7 +240,7 @@ class TestHouseholdIngredients:
             headers=auth_headers,
         )
         response = await client.get("/api/ingredients/household", headers=second_user_headers)
-        assert len(response.json()) == 0
+        assert len(response.json()["items"]) == 0
 
     async def test_add_ingredient_requires_name_or_id(
         self, client: AsyncClient, auth_headers: dict[str, str]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import RecipeFactory
+
+RANGE = {"start_date": "2026-03-01T00:00:00", "end_date": "2026-03-07T23:59:59"}
+
+
+async def _plan(
+    client: AsyncClient, headers: dict[str, str], recipe_id: str, day: int, servings: int = 2
+) -> None:
+    response = await client.post(
+        "/api/meal-plan/",
+        json={
+            "recipe_id": recipe_id,
+            "meal_date": f"2026-03-0{day}T18:00:00",
+            "meal_type": "dinner",
+            "servings": servings,
+        },
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+class TestGenerateShoppingList:
+    async def test_empty_range_returns_nothing(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.post(
+            "/api/meal-plan/generate-shopping-list", params=RANGE, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_generates_items_into_active_cart(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory("Pasta", [("pasta", 200.0, "g"), ("tomato", 3.0, None)])
+        await _plan(client, auth_headers, recipe_id, day=2)
+
+        response = await client.post(
+            "/api/meal-plan/generate-shopping-list", params=RANGE, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert {item["name"] for item in response.json()} == {"pasta", "tomato"}
+
+        carts = await client.get("/api/shopping/", headers=auth_headers)
+        items = carts.json()[0]["items"]
+        assert {item["name"] for item in items} == {"pasta", "tomato"}
+        assert all(item["added_from_recipe_id"] == recipe_id for item in items)
+
+    async def test_scales_by_servings_and_merges_duplicates(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        soup = await recipe_factory(
+            "Soup", [("tomato", 4.0, None), ("stock", 1.0, "l")], servings=4
+        )
+        salad = await recipe_factory("Salad", [("tomato", 2.0, None)], servings=2)
+        await _plan(client, auth_headers, soup, day=1, servings=2)
+        await _plan(client, auth_headers, soup, day=3, servings=6)
+        await _plan(client, auth_headers, salad, day=4, servings=2)
+
+        response = await client.post(
+            "/api/meal-plan/generate-shopping-list", params=RANGE, headers=auth_headers
+        )
+        assert response.status_code == 200
+        quantities = {item["name"]: item["quantity"] for item in response.json()}
+        # Soup is needed twice over (2/4 + 6/4), salad once
+        assert quantities == {"tomato": 10.0, "stock": 2.0}
+
+
+@pytest.mark.asyncio
+class TestMealPlanRecipeChecks:
+    async def test_create_with_unknown_recipe(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        response = await client.post(
+            "/api/meal-plan/",
+            json={
+                "recipe_id": "nonexistent",
+                "meal_date": "2026-03-02T18:00:00",
+                "meal_type": "dinner",
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Recipe not found"
+
+        listed = await client.get("/api/meal-plan/", params=RANGE, headers=auth_headers)
+        assert listed.json() == []
+
+    async def test_create_fills_defaults(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory("Toast", [("bread", 2.0, None)])
+        response = await client.post(
+            "/api/meal-plan/",
+            json={
+                "recipe_id": recipe_id,
+                "meal_date": "2026-03-02T08:00:00",
+                "meal_type": "breakfast",
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        data = response.json()
+        assert data["recipe_id"] == recipe_id
+        assert data["servings"] == 2
+        assert data["id"]
+
+    async def test_update_to_unknown_recipe(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory("Toast", [("bread", 2.0, None)])
+        await _plan(client, auth_headers, recipe_id, day=2)
+        plan_id = (await client.get("/api/meal-plan/", params=RANGE, headers=auth_headers)).json()[
+            0
+        ]["id"]
+
+        response = await client.put(
+            f"/api/meal-plan/{plan_id}", json={"recipe_id": "nonexistent"}, headers=auth_headers
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Recipe not found"
+
+        response = await client.put(
+            f"/api/meal-plan/{plan_id}", json={"servings": 5}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["servings"] == 5
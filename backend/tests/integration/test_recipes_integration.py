@@ -6,6 +6,7 @@ import pytest
 from httpx import AsyncClient
 
 from app.schemas.recipe import RecipeResponse, RecipeSearchResponse
+from tests.conftest import RecipeFactory
 
 
 def _mock_recipe_response() -> RecipeSearchResponse:
@@ -56,7 +57,7 @@ def _mock_recipe_response() -> RecipeSearchResponse:
 
 @pytest.mark.asyncio
 class TestRecipeSearch:
-    @patch("app.services.recipe.search_recipes_with_ai", new_callable=AsyncMock)
+    @patch("app.api.recipes.search_recipes_with_ai", new_callable=AsyncMock)
     async def test_search_recipes(
         self,
         mock_search: AsyncMock,
@@ -75,7 +76,7 @@ class TestRecipeSearch:
         assert len(data["recipes"]) == 1
         assert data["recipes"][0]["title"] == "Mock Thai Curry"
 
-    @patch("app.services.recipe.search_recipes_with_ai", new_callable=AsyncMock)
+    @patch("app.api.recipes.search_recipes_with_ai", new_callable=AsyncMock)
     async def test_search_recipes_with_filters(
         self,
         mock_search: AsyncMock,
@@ -161,4 +162,128 @@ class TestRecipeRatingAndFavorites:
             headers=auth_headers,
         )
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json()["items"] == []
+        assert response.json()["total"] == 0
+
+    async def test_get_recipe_with_rating_and_favorite(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        recipe_factory: RecipeFactory,
+        second_user_headers: dict[str, str],
+    ) -> None:
+        recipe_id = await recipe_factory("Omelette", [("egg", 3.0, None)])
+
+        await client.post(f"/api/recipes/{recipe_id}/rate", json={"score": 4}, headers=auth_headers)
+        await client.post(
+            f"/api/recipes/{recipe_id}/rate", json={"score": 2}, headers=second_user_headers
+        )
+        await client.post(f"/api/recipes/{recipe_id}/favorite", headers=auth_headers)
+
+        response = await client.get(f"/api/recipes/{recipe_id}", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == "Omelette"
+        assert data["average_rating"] == 3.0
+        assert data["user_rating"] == 4
+        assert data["is_favorite"] is True
+        assert [i["name"] for i in data["recipe_ingredients"]] == ["egg"]
+
+        other = await client.get(f"/api/recipes/{recipe_id}", headers=second_user_headers)
+        assert other.json()["user_rating"] == 2
+        assert other.json()["is_favorite"] is False
+
+    async def test_rerating_updates_existing_rating(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        url = f"/api/recipes/{recipe_id}/rate"
+        first = await client.post(url, json={"score": 2}, headers=auth_headers)
+        second = await client.post(
+            url, json={"score": 5, "review": "Better second time"}, headers=auth_headers
+        )
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["id"] == first.json()["id"]
+        assert second.json()["score"] == 5
+        assert second.json()["review"] == "Better second time"
+
+        response = await client.get(f"/api/recipes/{recipe_id}", headers=auth_headers)
+        assert response.json()["average_rating"] == 5.0
+
+    async def test_favorite_twice_reports_already_favorited(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        url = f"/api/recipes/{recipe_id}/favorite"
+        first = await client.post(url, headers=auth_headers)
+        second = await client.post(url, headers=auth_headers)
+        assert first.json() == {"status": "favorited"}
+        assert second.json() == {"status": "already_favorited"}
+
+    async def test_favorites_cursor_pagination(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_ids = {await recipe_factory() for _ in range(3)}
+        for recipe_id in recipe_ids:
+            await client.post(f"/api/recipes/{recipe_id}/favorite", headers=auth_headers)
+
+        url = "/api/recipes/favorites/list"
+        first = (await client.get(url, params={"limit": 2}, headers=auth_headers)).json()
+        assert len(first["items"]) == 2
+        assert first["total"] == 3
+        assert first["next_cursor"] == first["items"][-1]["id"]
+
+        second = (
+            await client.get(
+                url, params={"limit": 2, "cursor": first["next_cursor"]}, headers=auth_headers
+            )
+        ).json()
+        assert len(second["items"]) == 1
+        assert second["total"] == 3
+        assert second["next_cursor"] is None
+        seen = [item["id"] for item in first["items"] + second["items"]]
+        assert set(seen) == recipe_ids
+
+        offset_page = (
+            await client.get(url, params={"limit": 2, "offset": 2}, headers=auth_headers)
+        ).json()
+        assert [item["id"] for item in offset_page["items"]] == seen[2:]
+
+    async def test_favorites_unknown_cursor(
+        self, client: AsyncClient, auth_headers: dict[str, str], recipe_factory: RecipeFactory
+    ) -> None:
+        recipe_id = await recipe_factory()
+        await client.post(f"/api/recipes/{recipe_id}/favorite", headers=auth_headers)
+        url = "/api/recipes/favorites/list"
+
+        response = await client.get(url, params={"cursor": "nonexistent-id"}, headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+        # A cursor that was valid until the favorite was removed is stale, not the end of the list
+        await client.delete(f"/api/recipes/{recipe_id}/favorite", headers=auth_headers)
+        response = await client.get(url, params={"cursor": recipe_id}, headers=auth_headers)
+        assert response.status_code == 400
+
+    async def test_favorites_query_count(
+        self,
+        client: AsyncClient,
+        auth_headers: dict[str, str],
+        recipe_factory: RecipeFactory,
+        statements: list[str],
+    ) -> None:
+        for _ in range(3):
+            recipe_id = await recipe_factory()
+            await client.post(f"/api/recipes/{recipe_id}/favorite", headers=auth_headers)
+
+        statements.clear()
+        response = await client.get("/api/recipes/favorites/list", headers=auth_headers)
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert len(items) == 3
+        assert all(item["is_favorite"] for item in items)
+        assert not any("instructions" in item or "recipe_ingredients" in item for item in items)
+        # Current user and the page with its total; list cards don't load ingredients
+        assert len(statements) == 2
+        assert "instructions" not in statements[-1]
@@ -48,6 +48,24 @@ class TestShoppingCart:
         response = await client.get("/api/shopping/", headers=auth_headers)
         assert len(response.json()) == 2
 
+    async def test_list_carts_query_count(
+        self, client: AsyncClient, auth_headers: dict[str, str], statements: list[str]
+    ) -> None:
+        for name in ("Weekly", "Party"):
+            cart = await client.post("/api/shopping/", json={"name": name}, headers=auth_headers)
+            await client.post(
+                f"/api/shopping/{cart.json()['id']}/items",
+                json={"name": "milk"},
+                headers=auth_headers,
+            )
+
+        statements.clear()
+        response = await client.get("/api/shopping/", headers=auth_headers)
+        assert response.status_code == 200
+        assert all(len(cart["items"]) == 1 for cart in response.json())
+        # Current user with its household check, carts, and one batched load of every cart's items
+        assert len(statements) == 3
+
 
 @pytest.mark.asyncio
 class TestShoppingCartItems:
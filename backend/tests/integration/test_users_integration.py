@@ -46,6 +46,26 @@ class TestUserProfile:
         response = await client.get("/api/users/me", headers=auth_headers)
         assert response.json()["full_name"] == "Persisted Name"
 
+    async def test_combined_profile(
+        self, client: AsyncClient, auth_headers: dict[str, str]
+    ) -> None:
+        await client.post(
+            "/api/users/me/dietary-preferences",
+            json={"preference_type": "allergy", "value": "peanuts"},
+            headers=auth_headers,
+        )
+        await client.post(
+            "/api/users/me/health-goals",
+            json={"goal_type": "weight_loss", "description": "Lose 10 pounds"},
+            headers=auth_headers,
+        )
+        response = await client.get("/api/users/me/profile", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["user"]["email"] == "testuser@example.com"
+        assert [p["value"] for p in data["dietary_preferences"]] == ["peanuts"]
+        assert [g["goal_type"] for g in data["health_goals"]] == ["weight_loss"]
+
 
 @pytest.mark.asyncio
 class TestDietaryPreferences:
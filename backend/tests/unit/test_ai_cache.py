@@ -0,0 +1,44 @@
+"""Unit tests for the AI reply cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.ai.cache import ai_cache_key, cached_ai_call
+
+
+class TestAICacheKey:
+    def test_same_inputs_same_key(self) -> None:
+        key = ai_cache_key("suggest_substitutions", original_ingredient="egg", diet=["vegan"])
+        assert key == ai_cache_key(
+            "suggest_substitutions", diet=["vegan"], original_ingredient="egg"
+        )
+
+    def test_method_and_inputs_distinguish_keys(self) -> None:
+        key = ai_cache_key("parse_voice_input", transcript="two eggs")
+        assert key != ai_cache_key("parse_voice_input", transcript="three eggs")
+        assert key != ai_cache_key("identify_ingredients_from_image", transcript="two eggs")
+
+
+@pytest.mark.asyncio
+class TestCachedAICall:
+    async def test_second_call_served_from_cache(self) -> None:
+        call = AsyncMock(return_value={"ingredients": [{"name": "egg"}]})
+        key = ai_cache_key("parse_voice_input", transcript="one egg")
+
+        first = await cached_ai_call(key, call)
+        first["ingredients"].clear()
+        second = await cached_ai_call(key, call)
+
+        assert second == {"ingredients": [{"name": "egg"}]}
+        call.assert_awaited_once()
+
+    async def test_failures_are_not_cached(self) -> None:
+        call = AsyncMock(side_effect=[RuntimeError("provider down"), ["ok"]])
+        key = ai_cache_key("suggest_substitutions", original_ingredient="milk")
+
+        with pytest.raises(RuntimeError):
+            await cached_ai_call(key, call)
+        assert await cached_ai_call(key, call) == ["ok"]
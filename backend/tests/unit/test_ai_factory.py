@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -51,3 +51,20 @@ class TestGetAIService:
 
         with pytest.raises(ValueError, match="Unknown AI provider"):
             get_ai_service()
+
+
+@pytest.mark.asyncio
+class TestSharedClients:
+    async def test_client_reused_and_closed(self) -> None:
+        from app.services.ai import close_ai_clients
+        from app.services.ai.openai_service import get_client
+
+        get_client.cache_clear()
+        with patch("app.services.ai.openai_service.AsyncOpenAI") as mock_openai:
+            mock_openai.return_value.close = AsyncMock()
+            assert get_client() is get_client()
+            mock_openai.assert_called_once()
+
+            await close_ai_clients()
+        mock_openai.return_value.close.assert_awaited_once()
+        assert get_client.cache_info().currsize == 0
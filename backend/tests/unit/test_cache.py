@@ -0,0 +1,36 @@
+"""Unit tests for the in-process TTL cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_missing_key_returns_none(self) -> None:
+        cache = TTLCache(maxsize=10, ttl=30)
+        assert cache.get(b"missing") is None
+
+    def test_set_then_get(self) -> None:
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set(b"key", "user123")
+        assert cache.get(b"key") == "user123"
+
+    def test_entry_expires_after_ttl(self) -> None:
+        cache = TTLCache(maxsize=10, ttl=30)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set(b"key", "user123")
+        with patch("app.utils.cache.time.monotonic", return_value=1031.0):
+            assert cache.get(b"key") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set(b"a", "1")
+        cache.set(b"b", "2")
+        cache.get(b"a")
+        cache.set(b"c", "3")
+        assert cache.get(b"a") == "1"
+        assert cache.get(b"b") is None
+        assert cache.get(b"c") == "3"
@@ -38,6 +38,10 @@ class TestDefaultSettings:
         s = Settings(_env_file=None, _cli_parse_args=[])  # type: ignore[call-arg]
         assert s.port == 6000
 
+    def test_default_workers(self) -> None:
+        s = Settings(_env_file=None, _cli_parse_args=[])  # type: ignore[call-arg]
+        assert s.workers == 1
+
     def test_default_allowed_origins(self) -> None:
         s = Settings(_env_file=None, _cli_parse_args=[])  # type: ignore[call-arg]
         assert "http://localhost:6001" in s.allowed_origins
@@ -0,0 +1,68 @@
+"""Unit tests for engine configuration and startup in app/database.py."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.database import _engine_options, _set_sqlite_pragmas, init_db
+
+
+class TestEngineOptions:
+    def test_sqlite_only_sets_query_cache(self) -> None:
+        assert _engine_options("sqlite+aiosqlite:///./companis.db") == {
+            "query_cache_size": settings.db_query_cache_size
+        }
+
+    def test_server_database_gets_pool_settings(self) -> None:
+        options = _engine_options("postgresql+psycopg://user:pw@db/companis")
+        assert options == {
+            "query_cache_size": settings.db_query_cache_size,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout_seconds,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
+    def test_asyncpg_gets_prepared_statement_cache(self) -> None:
+        options = _engine_options("postgresql+asyncpg://user:pw@db/companis")
+        assert options["connect_args"] == {
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size
+        }
+
+    def test_external_pooler_disables_app_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "db_external_pooler", True)
+        options = _engine_options("postgresql+asyncpg://user:pw@pgbouncer/companis")
+        assert options == {
+            "query_cache_size": settings.db_query_cache_size,
+            "poolclass": NullPool,
+            "connect_args": {"prepared_statement_cache_size": 0},
+        }
+
+
+class TestSqlitePragmas:
+    def test_connect_hook_enables_wal(self, tmp_path: Path) -> None:
+        conn = sqlite3.connect(tmp_path / "pragmas.db")
+        try:
+            _set_sqlite_pragmas(conn, None)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        finally:
+            conn.close()
+
+
+class TestInitDb:
+    async def test_skips_create_all_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        engine = MagicMock()
+        monkeypatch.setattr(settings, "db_create_tables", False)
+        monkeypatch.setattr("app.database.engine", engine)
+        await init_db()
+        engine.begin.assert_not_called()
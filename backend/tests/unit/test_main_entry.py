@@ -7,6 +7,19 @@ from unittest.mock import patch
 
 import pytest
 
+_SETTINGS: dict[str, Any] = {
+    "host": "0.0.0.0",  # noqa: S104
+    "port": 6000,
+    "debug": False,
+    "workers": 1,
+    "database_url": "sqlite+aiosqlite:///./companis.db",
+    "db_create_tables": True,
+}
+
+
+def _fake_settings(**overrides: Any) -> object:
+    return type("FakeSettings", (), {**_SETTINGS, **overrides})()
+
 
 @pytest.fixture
 def _isolate_settings(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -14,7 +27,7 @@ def _isolate_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     fake = type(
         "FakeSettings",
         (),
-        {"host": "127.0.0.1", "port": 7777, "debug": True},
+        {**_SETTINGS, "host": "127.0.0.1", "port": 7777, "debug": True},
     )()
     monkeypatch.setattr("app.__main__.settings", fake)
 
@@ -70,15 +83,98 @@ class TestMainEntry:
         self, mock_run: Any, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """reload should be False when settings.debug is False."""
-        fake = type(
-            "FakeSettings",
-            (),
-            {"host": "0.0.0.0", "port": 6000, "debug": False},  # noqa: S104
-        )()
-        monkeypatch.setattr("app.__main__.settings", fake)
+        monkeypatch.setattr("app.__main__.settings", _fake_settings())
 
         from app.__main__ import main
 
         main()
         _, kwargs = mock_run.call_args
         assert kwargs["reload"] is False
+
+    @patch("app.__main__.uvicorn.run")
+    def test_main_pins_http_parser(self, mock_run: Any) -> None:
+        """main() should request the httptools parser explicitly."""
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["http"] == "httptools"
+
+    @patch("app.__main__.uvicorn.run")
+    def test_main_uses_uvloop_off_windows(
+        self, mock_run: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """main() should select uvloop unless running on Windows."""
+        monkeypatch.setattr("app.__main__.sys.platform", "linux")
+
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["loop"] == "uvloop"
+
+    @patch("app.__main__.uvicorn.run")
+    def test_main_single_worker_in_debug(self, mock_run: Any) -> None:
+        """Reload mode is incompatible with workers, so none are requested."""
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["workers"] is None
+
+    @patch("app.__main__.uvicorn.run")
+    def test_main_single_worker_by_default(
+        self, mock_run: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Outside debug, the workers setting defaults to one process."""
+        monkeypatch.setattr("app.__main__.settings", _fake_settings())
+        monkeypatch.setattr("app.__main__.os.cpu_count", lambda: 4)
+
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["workers"] == 1
+
+    @patch("app.__main__.uvicorn.run")
+    def test_main_uses_configured_workers(
+        self, mock_run: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An explicit workers setting is passed through."""
+        monkeypatch.setattr("app.__main__.settings", _fake_settings(workers=3))
+
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["workers"] == 3
+
+    @pytest.mark.parametrize(
+        ("database_url", "db_create_tables", "expected"),
+        [
+            ("sqlite+aiosqlite:///./companis.db", False, 1),
+            ("postgresql+asyncpg://db/companis", True, 1),
+            ("postgresql+asyncpg://db/companis", False, 4),
+        ],
+    )
+    @patch("app.__main__.uvicorn.run")
+    def test_main_auto_workers_need_managed_server_database(
+        self,
+        mock_run: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        database_url: str,
+        db_create_tables: bool,
+        expected: int,
+    ) -> None:
+        """workers=0 only fans out per CPU on a server database without create_all."""
+        fake = _fake_settings(
+            workers=0, database_url=database_url, db_create_tables=db_create_tables
+        )
+        monkeypatch.setattr("app.__main__.settings", fake)
+        monkeypatch.setattr("app.__main__.os.cpu_count", lambda: 4)
+
+        from app.__main__ import main
+
+        main()
+        _, kwargs = mock_run.call_args
+        assert kwargs["workers"] == expected
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import importlib
+import pkgutil
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
+from app import schemas
 from app.schemas.ingredient import (
     BarcodeScanResult,
     CameraScanResult,
@@ -169,3 +173,20 @@ class TestSubstitutionSuggestion:
             ratio="1:1",
         )
         assert sub.substitute == "coconut oil"
+
+
+class TestSchemasComplete:
+    @pytest.mark.parametrize(
+        "module_name", [module.name for module in pkgutil.iter_modules(schemas.__path__)]
+    )
+    def test_built_at_import(self, module_name: str) -> None:
+        module = importlib.import_module(f"app.schemas.{module_name}")
+        incomplete = [
+            name
+            for name, cls in vars(module).items()
+            if isinstance(cls, type)
+            and issubclass(cls, BaseModel)
+            and cls.__module__ == module.__name__
+            and not cls.__pydantic_complete__
+        ]
+        assert incomplete == []
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
+import bcrypt
 from jose import jwt
 
 from app.config import settings
 from app.utils.security import (
+    DUMMY_HASH,
     create_access_token,
     create_refresh_token,
     decode_token,
     hash_password,
+    login_cache_key,
+    password_needs_rehash,
     verify_password,
 )
 
@@ -37,6 +42,15 @@ class TestPasswordHashing:
         hashed = hash_password("testpassword123")
         assert verify_password("", hashed) is False
 
+    def test_verify_password_malformed_hash(self) -> None:
+        assert verify_password("testpassword123", "not-a-bcrypt-hash") is False
+
+    def test_verify_password_uses_constant_time_compare(self) -> None:
+        hashed = hash_password("testpassword123")
+        with patch("app.utils.security.hmac.compare_digest", return_value=True) as mock_cmp:
+            assert verify_password("testpassword123", hashed) is True
+        mock_cmp.assert_called_once()
+
     def test_hash_password_special_characters(self) -> None:
         password = "p@$$w0rd!#%^&*()"
         hashed = hash_password(password)
@@ -53,6 +67,27 @@ class TestPasswordHashing:
         hashed = hash_password(password)
         assert verify_password(password, hashed) is True
 
+    def test_passwords_differing_after_72_bytes_are_distinct(self) -> None:
+        hashed = hash_password("a" * 72 + "first")
+        assert verify_password("a" * 72 + "first", hashed) is True
+        assert verify_password("a" * 72 + "second", hashed) is False
+
+    def test_new_hashes_are_prehashed(self) -> None:
+        hashed = hash_password("testpassword123")
+        assert hashed.startswith("$hmac-sha256$2b$")
+        assert password_needs_rehash(hashed) is False
+
+    def test_legacy_bcrypt_hash_still_verifies(self) -> None:
+        legacy = bcrypt.hashpw(b"testpassword123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+        assert verify_password("testpassword123", legacy) is True
+        assert verify_password("wrongpassword", legacy) is False
+        assert password_needs_rehash(legacy) is True
+
+    def test_pepper_change_invalidates_hash(self) -> None:
+        hashed = hash_password("testpassword123")
+        with patch("app.utils.security.settings.password_pepper", "rotated"):
+            assert verify_password("testpassword123", hashed) is False
+
 
 class TestAccessToken:
     def test_create_access_token_returns_string(self) -> None:
@@ -143,3 +178,18 @@ class TestDecodeToken:
         )
         payload = decode_token(token)
         assert payload is None
+
+
+class TestLoginCache:
+    def test_key_depends_on_email_and_password(self) -> None:
+        key = login_cache_key("a@example.com", "password")
+        assert key == login_cache_key("a@example.com", "password")
+        assert key != login_cache_key("a@example.com", "other")
+        assert key != login_cache_key("b@example.com", "password")
+        assert b"password" not in key
+
+
+class TestDummyHash:
+    def test_dummy_hash_is_valid_bcrypt(self) -> None:
+        assert DUMMY_HASH.startswith("$hmac-sha256$2b$")
+        assert verify_password("anything", DUMMY_HASH) is False
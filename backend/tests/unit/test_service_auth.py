@@ -1,6 +1,6 @@
 """Unit tests for the OAuth authentication service.
 
-These tests mock httpx.AsyncClient and settings to verify that
+These tests mock the shared HTTP client and settings to verify that
 the auth service correctly builds OAuth URLs and exchanges tokens
 for user info without making real HTTP requests.
 """
@@ -10,6 +10,7 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from jose import jwt
 
 from app.services.auth import (
     FACEBOOK_AUTH_URL,
@@ -102,9 +103,9 @@ def _mock_response(status_code: int, json_data: dict) -> MagicMock:
 @pytest.mark.asyncio
 class TestGetOAuthUserInfoGoogle:
     @patch("app.services.auth.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.auth.get_http_client")
     async def test_google_successful_flow(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.oauth_redirect_base_url = "http://localhost:8000"
         mock_settings.google_client_id = "g-client-id"
@@ -124,8 +125,7 @@ class TestGetOAuthUserInfoGoogle:
         mock_client_instance = AsyncMock()
         mock_client_instance.post.return_value = token_response
         mock_client_instance.get.return_value = user_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await get_oauth_user_info("google", "auth-code-123")
 
@@ -149,9 +149,9 @@ class TestGetOAuthUserInfoGoogle:
         assert get_call[1]["headers"]["Authorization"] == "Bearer google-access-token"
 
     @patch("app.services.auth.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.auth.get_http_client")
     async def test_google_failed_token_exchange(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.oauth_redirect_base_url = "http://localhost:8000"
         mock_settings.google_client_id = "g-client-id"
@@ -161,17 +161,16 @@ class TestGetOAuthUserInfoGoogle:
 
         mock_client_instance = AsyncMock()
         mock_client_instance.post.return_value = token_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await get_oauth_user_info("google", "bad-code")
 
         assert result is None
 
     @patch("app.services.auth.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.auth.get_http_client")
     async def test_google_failed_user_info_fetch(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.oauth_redirect_base_url = "http://localhost:8000"
         mock_settings.google_client_id = "g-client-id"
@@ -183,20 +182,92 @@ class TestGetOAuthUserInfoGoogle:
         mock_client_instance = AsyncMock()
         mock_client_instance.post.return_value = token_response
         mock_client_instance.get.return_value = user_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await get_oauth_user_info("google", "auth-code")
 
         assert result is None
 
 
+    @patch("app.services.auth.settings")
+    @patch("app.services.auth.get_http_client")
+    async def test_google_id_token_skips_user_info_fetch(
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        mock_settings.oauth_redirect_base_url = "http://localhost:8000"
+        mock_settings.google_client_id = "g-client-id"
+        mock_settings.google_client_secret = "g-client-secret"
+
+        id_token = jwt.encode(
+            {
+                "iss": "https://accounts.google.com",
+                "aud": "g-client-id",
+                "sub": "google-user-123",
+                "email": "user@gmail.com",
+                "name": "Test User",
+                "picture": "https://example.com/photo.jpg",
+            },
+            "google-signing-key",
+        )
+        token_response = _mock_response(
+            200, {"access_token": "google-access-token", "id_token": id_token}
+        )
+
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = token_response
+        mock_get_client.return_value = mock_client_instance
+
+        result = await get_oauth_user_info("google", "auth-code-123")
+
+        assert result == {
+            "id": "google-user-123",
+            "email": "user@gmail.com",
+            "name": "Test User",
+            "avatar_url": "https://example.com/photo.jpg",
+        }
+        mock_client_instance.get.assert_not_called()
+
+    @patch("app.services.auth.settings")
+    @patch("app.services.auth.get_http_client")
+    async def test_google_id_token_for_other_client_falls_back(
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        mock_settings.oauth_redirect_base_url = "http://localhost:8000"
+        mock_settings.google_client_id = "g-client-id"
+        mock_settings.google_client_secret = "g-client-secret"
+
+        id_token = jwt.encode(
+            {
+                "iss": "https://accounts.google.com",
+                "aud": "someone-else",
+                "sub": "other",
+                "email": "other@gmail.com",
+            },
+            "google-signing-key",
+        )
+        token_response = _mock_response(200, {"access_token": "tok", "id_token": id_token})
+        user_response = _mock_response(
+            200, {"id": "google-user-123", "email": "user@gmail.com", "name": "Test User"}
+        )
+
+        mock_client_instance = AsyncMock()
+        mock_client_instance.post.return_value = token_response
+        mock_client_instance.get.return_value = user_response
+        mock_get_client.return_value = mock_client_instance
+
+        result = await get_oauth_user_info("google", "auth-code-123")
+
+        assert result is not None
+        assert result["id"] == "google-user-123"
+        mock_client_instance.get.assert_called_once()
+
+
 @pytest.mark.asyncio
 class TestGetOAuthUserInfoFacebook:
     @patch("app.services.auth.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.auth.get_http_client")
     async def test_facebook_successful_flow(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.oauth_redirect_base_url = "http://localhost:8000"
         mock_settings.facebook_client_id = "fb-client-id"
@@ -216,8 +287,7 @@ class TestGetOAuthUserInfoFacebook:
         mock_client_instance = AsyncMock()
         # Facebook uses GET for both token and user info
         mock_client_instance.get.side_effect = [token_response, user_response]
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await get_oauth_user_info("facebook", "fb-auth-code")
 
@@ -241,9 +311,9 @@ class TestGetOAuthUserInfoFacebook:
         assert "id,name,email,picture" in second_get_call[1]["params"]["fields"]
 
     @patch("app.services.auth.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.auth.get_http_client")
     async def test_facebook_failed_token_exchange(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.oauth_redirect_base_url = "http://localhost:8000"
         mock_settings.facebook_client_id = "fb-client-id"
@@ -253,8 +323,7 @@ class TestGetOAuthUserInfoFacebook:
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get.return_value = token_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await get_oauth_user_info("facebook", "bad-code")
 
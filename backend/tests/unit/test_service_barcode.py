@@ -1,6 +1,6 @@
 """Unit tests for the barcode lookup service.
 
-These tests mock httpx.AsyncClient for OpenFoodFacts API calls and
+These tests mock the shared HTTP client for OpenFoodFacts API calls and
 AsyncSession for database operations, verifying that barcode lookup
 correctly handles existing ingredients, external API results, and
 various failure modes.
@@ -24,9 +24,9 @@ from app.services.barcode import _fetch_openfoodfacts, lookup_barcode
 @pytest.mark.asyncio
 class TestFetchOpenFoodFacts:
     @patch("app.services.barcode.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.barcode.get_http_client")
     async def test_successful_response(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.openfoodfacts_api_url = "https://world.openfoodfacts.org/api/v2"
 
@@ -44,8 +44,7 @@ class TestFetchOpenFoodFacts:
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get.return_value = mock_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await _fetch_openfoodfacts("1234567890123")
 
@@ -59,9 +58,9 @@ class TestFetchOpenFoodFacts:
         )
 
     @patch("app.services.barcode.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.barcode.get_http_client")
     async def test_non_200_status(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.openfoodfacts_api_url = "https://world.openfoodfacts.org/api/v2"
 
@@ -70,17 +69,16 @@ class TestFetchOpenFoodFacts:
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get.return_value = mock_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await _fetch_openfoodfacts("0000000000000")
 
         assert result is None
 
     @patch("app.services.barcode.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.barcode.get_http_client")
     async def test_status_not_1_in_response(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.openfoodfacts_api_url = "https://world.openfoodfacts.org/api/v2"
 
@@ -90,24 +88,22 @@ class TestFetchOpenFoodFacts:
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get.return_value = mock_response
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await _fetch_openfoodfacts("9999999999999")
 
         assert result is None
 
     @patch("app.services.barcode.settings")
-    @patch("httpx.AsyncClient")
+    @patch("app.services.barcode.get_http_client")
     async def test_http_error_exception(
-        self, mock_client_cls: MagicMock, mock_settings: MagicMock
+        self, mock_get_client: MagicMock, mock_settings: MagicMock
     ) -> None:
         mock_settings.openfoodfacts_api_url = "https://world.openfoodfacts.org/api/v2"
 
         mock_client_instance = AsyncMock()
         mock_client_instance.get.side_effect = httpx.HTTPError("Connection refused")
-        mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client_instance
 
         result = await _fetch_openfoodfacts("1111111111111")
 
@@ -0,0 +1,20 @@
+"""Unit tests for the shared third-party HTTP client."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.http_client import close_http_client, get_http_client
+
+
+@pytest.mark.asyncio
+class TestSharedHttpClient:
+    async def test_reused_until_closed(self) -> None:
+        await close_http_client()
+        client = get_http_client()
+        assert get_http_client() is client
+
+        await close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        await close_http_client()